@@ -0,0 +1,312 @@
+import os
+import tempfile
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("The all-pairs shortest paths engine requires NumPy: pip install numpy") from error
+
+from bitset import edge_density
+from csr import CSRGraph, SnapshotPool
+from Djkstra import dijkstra_csr
+from vectorized import bellman_ford, csr_arrays
+
+# Edge density from which "auto" runs Floyd-Warshall instead of Johnson's algorithm
+DENSE_GRAPH_DENSITY = 0.25
+# Matrix cells per block of rows that Floyd-Warshall keeps in memory at a time
+FLOYD_BLOCK_CELLS = 1 << 21
+
+
+class DistanceMatrix:
+    """
+    All-pairs distance matrix stored in a memory-mapped `.npy` file, row i holding the
+    distances from vertex ID i. Integer weights give the smallest integer dtype that can
+    hold every distance, with the dtype's maximum value marking unreachable pairs;
+    float weights give float64 with `inf`. Rows are read from disk on access, so
+    streaming through `iter_rows` keeps one row in memory at a time.
+    """
+
+    def __init__(self, file_path: str, labels, matrix, temporary: bool = False) -> None:
+        """
+        Time Complexity: O(1)
+        :param file_path: `.npy` file backing the matrix
+        :param labels: sequence mapping vertex ID -> vertex label
+        :param matrix: memory-mapped `numpy.ndarray`
+        :param temporary: delete the file on `close`
+        """
+        self.file_path = file_path
+        self.labels = labels
+        self.matrix = matrix
+        self.temporary = temporary
+        self.index = {label: vertex_id for vertex_id, label in enumerate(labels)}
+        self.unreachable = np.inf if matrix.dtype.kind == "f" else np.iinfo(matrix.dtype).max
+
+    @classmethod
+    def open(cls, file_path: str, labels) -> "DistanceMatrix":
+        """
+        Memory-maps a matrix written by `all_pairs_shortest_paths`, read-only.
+        Time Complexity: O(1)
+        :return: `DistanceMatrix`
+        """
+        return cls(file_path, labels, np.load(file_path, mmap_mode="r"))
+
+    def vertex_id(self, vertex_name) -> int:
+        if vertex_name not in self.index:
+            raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
+        return self.index[vertex_name]
+
+    def distance(self, vertex1, vertex2):
+        """
+        Shortest distance from vertex1 to vertex2, `float('inf')` when unreachable.
+        Time Complexity: O(1)
+        """
+        distance = self.matrix[self.vertex_id(vertex1), self.vertex_id(vertex2)]
+        return float('inf') if distance == self.unreachable else distance.item()
+
+    def row(self, vertex_name) -> "np.ndarray":
+        """
+        Returns a copy of the raw distance row of a vertex, indexed by vertex ID.
+        :return: `numpy.ndarray`
+        """
+        return np.array(self.matrix[self.vertex_id(vertex_name)])
+
+    def iter_rows(self):
+        """
+        Yields `(label, row)` for every vertex in ID order, reading one row at a time.
+        """
+        for vertex_id, label in enumerate(self.labels):
+            yield label, np.array(self.matrix[vertex_id])
+
+    def close(self) -> None:
+        """
+        Releases the memory map, deleting the file if it is temporary.
+        :return: `None`
+        """
+        # dropping the last reference unmaps the file
+        self.matrix = None
+        if self.temporary:
+            os.remove(self.file_path)
+
+    def __enter__(self) -> "DistanceMatrix":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _result_dtype(weights, vertex_count: int):
+    """
+    Smallest dtype holding every possible distance. A shortest path has at most V - 1
+    edges, so (V - 1) * max|w| bounds the absolute value of every distance.
+    """
+    if weights.dtype.kind == "f":
+        return np.dtype(np.float64)
+    bound = max(0, vertex_count - 1) * (int(np.abs(weights).max()) if len(weights) else 0) + 1
+    for dtype in (np.int32, np.int64):
+        if bound < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError("Distances do not fit in a 64-bit integer matrix.")
+
+
+def _load_rows(matrix, start: int, stop: int):
+    """
+    Reads rows [start, stop) of the result matrix as float64, mapping the unreachable marker to inf.
+    """
+    rows = np.array(matrix[start:stop], dtype=np.float64)
+    if matrix.dtype.kind != "f":
+        rows[matrix[start:stop] == np.iinfo(matrix.dtype).max] = np.inf
+    return rows
+
+
+def _store_rows(matrix, start: int, rows) -> None:
+    """
+    Writes a float64 block of distance rows into the result matrix from row `start`,
+    mapping inf to the unreachable marker.
+    """
+    stop = start + len(rows)
+    if matrix.dtype.kind == "f":
+        matrix[start:stop] = rows
+    else:
+        unreachable = np.isinf(rows)
+        stored = np.rint(np.where(unreachable, 0, rows)).astype(matrix.dtype)
+        stored[unreachable] = np.iinfo(matrix.dtype).max
+        matrix[start:stop] = stored
+
+
+def floyd_warshall(csr: CSRGraph, matrix, block_rows: int = None) -> None:
+    """
+    Blocked, vectorised Floyd-Warshall that relaxes the result matrix in place, one block
+    of rows at a time. The intermediate vertices are taken in panels matching the row
+    blocks: the panel's own rows are relaxed first through each of its vertices k in turn,
+    then every other block is relaxed through the finished panel rows. Entries only ever
+    decrease to lengths of real walks, so using panel rows that are already relaxed
+    further than plain Floyd-Warshall's keeps the result exact. Negative weights are
+    allowed; a negative cycle raises ValueError.
+    Time Complexity: O(V^3) in V * V / block_rows NumPy steps, O(V * block_rows) memory
+    :param csr: weighted `CSRGraph`
+    :param matrix: V x V output array, typically memory-mapped
+    :param block_rows: rows per block, by default about FLOYD_BLOCK_CELLS cells
+    :return: `None`
+    """
+    offsets, targets, weights = csr_arrays(csr)
+    vertex_count = csr.get_v()
+    if block_rows is None:
+        block_rows = max(1, FLOYD_BLOCK_CELLS // max(1, vertex_count))
+    blocks = [(start, min(start + block_rows, vertex_count)) for start in range(0, vertex_count, block_rows)]
+    # without a negative cycle no distance is below -(V - 1) * max|w|
+    lower_bound = -max(0, vertex_count - 1) * (float(np.abs(weights).max()) if len(weights) else 0.0)
+
+    for start, stop in blocks:
+        rows = np.full((stop - start, vertex_count), np.inf)
+        sources = np.repeat(np.arange(stop - start), np.diff(offsets[start:stop + 1]))
+        edges = slice(offsets[start], offsets[stop])
+        # parallel arcs keep their lightest weight
+        np.minimum.at(rows, (sources, targets[edges]), weights[edges].astype(np.float64))
+        diagonal = (np.arange(stop - start), np.arange(start, stop))
+        rows[diagonal] = np.minimum(rows[diagonal], 0)
+        _store_rows(matrix, start, rows)
+
+    def relax(rows, start, stop, panel, panel_start):
+        for k in range(panel_start, panel_start + len(panel)):
+            np.minimum(rows, rows[:, k, None] + panel[None, k - panel_start], out=rows)
+        diagonal = rows[np.arange(stop - start), np.arange(start, stop)]
+        if (diagonal < 0).any() or rows.min() < lower_bound:
+            raise ValueError("The graph has a negative cycle.")
+
+    for panel_start, panel_stop in blocks:
+        # relaxing the panel rows through the panel's own vertices only reads panel rows
+        panel = _load_rows(matrix, panel_start, panel_stop)
+        relax(panel, panel_start, panel_stop, panel, panel_start)
+        _store_rows(matrix, panel_start, panel)
+        for start, stop in blocks:
+            if start == panel_start:
+                continue
+            rows = _load_rows(matrix, start, stop)
+            relax(rows, start, stop, panel, panel_start)
+            _store_rows(matrix, start, rows)
+
+
+def johnson_reweighting(csr: CSRGraph) -> tuple:
+    """
+    Johnson's reweighting: Bellman-Ford potentials h from a virtual source joined to every
+    vertex by a zero edge make every weight w(u, v) + h(u) - h(v) non-negative, while
+    preserving shortest paths. Graphs without negative weights are returned unchanged.
+    Time Complexity: O(V * E) worst case
+    :param csr: weighted `CSRGraph`
+    :return: `tuple` (reweighted `CSRGraph`, potentials float64 array)
+    """
+    offsets, targets, weights = csr_arrays(csr)
+    vertex_count = csr.get_v()
+    if not len(weights) or weights.min() >= 0:
+        return csr, np.zeros(vertex_count)
+
+    # starting every vertex at distance 0 is the virtual source's first relaxation
+    potentials = bellman_ford(csr, np.arange(vertex_count))[0]
+    sources = np.repeat(np.arange(vertex_count), np.diff(offsets))
+    reweighted = weights + potentials[sources] - potentials[targets]
+    typecode = "q" if weights.dtype.kind == "i" else "d"
+    new_weights = array(typecode, reweighted.astype(weights.dtype).tobytes())
+    return CSRGraph(csr.labels, csr.offsets, csr.targets, new_weights, csr.is_directed, True), potentials
+
+
+def _johnson_rows(csr, state, source_ids) -> int:
+    """
+    Runs Dijkstra on the reweighted snapshot from each source and writes the row, with the
+    original weights restored, straight into the result matrix. Run by `SnapshotPool`.
+    :param state: `(potentials, matrix_path)`
+    :return: `int` number of rows written
+    """
+    potentials, matrix_path = state
+    matrix = np.load(matrix_path, mmap_mode="r+")
+    for source_id in source_ids:
+        row = np.array(dijkstra_csr(csr, source_id)[0], dtype=np.float64)
+        row += potentials - potentials[source_id]
+        _store_rows(matrix, source_id, row[None])
+    matrix.flush()
+    return len(source_ids)
+
+
+def johnson(csr: CSRGraph, matrix_path: str, workers: int = None, chunksize: int = 16) -> None:
+    """
+    Johnson's algorithm: reweights the graph once, then runs Dijkstra from every source
+    across a `SnapshotPool` that shares the reweighted CSR snapshot. Every worker writes
+    its rows straight into the memory-mapped result file, so no distance row is kept in
+    memory or sent between processes.
+    Time Complexity: O(V * E + V (V + E) log V / workers)
+    :param csr: weighted `CSRGraph`
+    :param matrix_path: `.npy` result file, already created with shape V x V
+    :param workers: number of processes, defaults to the number of CPUs
+    :param chunksize: number of sources per task
+    :return: `None`
+    """
+    reweighted, potentials = johnson_reweighting(csr)
+    batches = [range(start, min(start + chunksize, csr.get_v())) for start in range(0, csr.get_v(), chunksize)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with SnapshotPool(reweighted, workers if len(batches) > 1 else 1, (potentials, matrix_path)) as pool:
+        for _ in pool.map(_johnson_rows, batches):
+            pass
+
+
+def all_pairs_shortest_paths(graph, file_path: str = None, method: str = "auto",
+                             workers: int = None) -> DistanceMatrix:
+    """
+    All-pairs shortest distances written to a memory-mapped matrix on disk.
+    "auto" runs vectorised Floyd-Warshall on dense graphs (edge density at least
+    DENSE_GRAPH_DENSITY) and Johnson's algorithm with parallel Dijkstra otherwise.
+    Both accept negative weights and raise ValueError on a negative cycle.
+    Time Complexity: O(V^3) for Floyd-Warshall, O(V (V + E) log V) for Johnson
+    :param graph: weighted `SimpleDirectedGraph` or `CSRGraph`
+    :param file_path: `.npy` output file, a temporary file deleted on `close` by default
+    :param method: "auto", "floyd_warshall" or "johnson"
+    :param workers: number of processes for Johnson's algorithm
+    :return: `DistanceMatrix` over the snapshot's vertex IDs
+    """
+    if not graph.is_weighted:
+        raise ValueError("All-pairs shortest paths require a weighted graph.")
+    if method not in ("auto", "floyd_warshall", "johnson"):
+        raise ValueError(f"Unknown method '{method}', expected 'auto', 'floyd_warshall' or 'johnson'.")
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    if method == "auto":
+        method = "floyd_warshall" if edge_density(csr) >= DENSE_GRAPH_DENSITY else "johnson"
+
+    temporary = file_path is None
+    if temporary:
+        handle, file_path = tempfile.mkstemp(suffix=".npy")
+        os.close(handle)
+    vertex_count = csr.get_v()
+    dtype = _result_dtype(csr_arrays(csr)[2], vertex_count)
+    matrix = np.lib.format.open_memmap(file_path, mode="w+", dtype=dtype, shape=(vertex_count, vertex_count))
+
+    try:
+        if method == "floyd_warshall":
+            floyd_warshall(csr, matrix)
+        matrix.flush()
+        del matrix
+        if method == "johnson":
+            johnson(csr, file_path, workers)
+    except BaseException:
+        if temporary:
+            os.remove(file_path)
+        raise
+
+    result = DistanceMatrix.open(file_path, list(csr.labels))
+    result.temporary = temporary
+    return result
+
+
+def run_apsp_analysis(graph, method: str = "auto", workers: int = None):
+    """
+    Prints the all-pairs shortest paths analysis
+    """
+    start_time = time.time()
+    with all_pairs_shortest_paths(graph, method=method, workers=workers) as distances:
+        timing = (time.time() - start_time) * 1000
+        print(f"All-pairs shortest distances ({distances.matrix.dtype}):")
+        for label, row in distances.iter_rows():
+            print(f"{label}: {' '.join('-' if value == distances.unreachable else str(value) for value in row)}")
+        print(f"Time: {timing:.2f}ms")
@@ -0,0 +1,203 @@
+import heapq
+import random
+import time
+
+from domain import SimpleDirectedGraph
+from Djkstra import get_walk
+
+
+def zero_heuristic(vertex, goal_vertex) -> int:
+    """
+    Trivial admissible heuristic, A* with it behaves like Dijkstra.
+    """
+    return 0
+
+
+def a_star(graph: SimpleDirectedGraph, start_vertex, goal_vertex, heuristic=None):
+    """
+    A* search on a weighted graph with non-negative weights.
+    The heuristic is any callable `heuristic(vertex, goal_vertex)` returning a lower
+    bound of the distance from vertex to goal_vertex, e.g. an `ALTHeuristic`.
+    Time Complexity: O((V + E) log V), settling only vertices that look promising towards the goal
+    :param heuristic: admissible heuristic, `zero_heuristic` by default
+    :return: distance (inf when unreachable), path, timing, cost_calls, heap_pushes, heap_pops
+    """
+    if not graph.is_weighted:
+        raise ValueError("A* requires a weighted graph.")
+    graph.vertex_id(start_vertex)
+    graph.vertex_id(goal_vertex)
+    if heuristic is None:
+        heuristic = zero_heuristic
+
+    distances = {start_vertex: 0}
+    previous_vertices = {start_vertex: None}
+    priority_queue = [(heuristic(start_vertex, goal_vertex), 0, start_vertex)]
+
+    cost_calls = 0
+    heap_pushes = 0
+    heap_pops = 0
+
+    start_time = time.time()
+
+    found = False
+    while priority_queue:
+        _, current_distance, current_vertex = heapq.heappop(priority_queue)
+        heap_pops += 1
+
+        if current_distance > distances[current_vertex]:
+            continue
+        if current_vertex == goal_vertex:
+            found = True
+            break
+
+        for neighbor, edge_weight in graph.iter_neighbours(current_vertex):
+            cost_calls += 1
+            distance = current_distance + edge_weight
+
+            if distance < distances.get(neighbor, float('inf')):
+                estimate = heuristic(neighbor, goal_vertex)
+                if estimate == float('inf'):
+                    continue
+                distances[neighbor] = distance
+                previous_vertices[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance + estimate, distance, neighbor))
+                heap_pushes += 1
+
+    end_time = time.time()
+    timing = (end_time - start_time) * 1000
+
+    if not found:
+        return float('inf'), [], timing, cost_calls, heap_pushes, heap_pops
+    path = get_walk(previous_vertices, start_vertex, goal_vertex)
+    return distances[goal_vertex], path, timing, cost_calls, heap_pushes, heap_pops
+
+
+def _distance_table(graph: SimpleDirectedGraph, source, expand) -> dict:
+    """
+    Plain Dijkstra returning only the distances of the reachable vertices.
+    `expand` is `graph.iter_neighbours` for distances from source,
+    or `graph.inbound_expander()` for distances to source.
+    """
+    distances = {source: 0}
+    priority_queue = [(0, source)]
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_distance > distances[current_vertex]:
+            continue
+        for neighbor, edge_weight in expand(current_vertex):
+            distance = current_distance + edge_weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                heapq.heappush(priority_queue, (distance, neighbor))
+    return distances
+
+
+class ALTHeuristic:
+    """
+    ALT (A*, landmarks and triangle inequality) heuristic.
+    Preprocessing picks K landmarks and stores the distances from and to every landmark.
+    For a landmark L the triangle inequality gives the lower bounds
+        d(v, t) >= d(L, t) - d(L, v)   and   d(v, t) >= d(v, L) - d(t, L)
+    and the heuristic returns the best of them over all landmarks.
+    On directed graphs the backward tables are computed over inbound edges, through
+    `graph.inbound_expander()`: the incoming-edge index (`track_inbound=True`) or a
+    reverse adjacency built once for the whole preprocessing.
+    """
+
+    def __init__(self, graph: SimpleDirectedGraph, landmark_count: int = 4, landmarks=None, seed=None) -> None:
+        """
+        Time Complexity: O(K (V + E) log V)
+        :param graph: weighted graph with non-negative weights
+        :param landmark_count: number of landmarks K picked by farthest selection
+        :param landmarks: explicit list of landmark vertices, overrides landmark_count
+        :param seed: seed for the first landmark
+        """
+        if not graph.is_weighted:
+            raise ValueError("ALT landmarks require a weighted graph.")
+        if graph.get_v() == 0:
+            raise ValueError("Graph is empty")
+
+        self.graph = graph
+        self.landmarks = []
+        self.from_landmark = []
+        self.to_landmark = []
+
+        # built once for the backward tables of every landmark
+        expand_inbound = graph.inbound_expander() if graph.is_directed else None
+        if landmarks is not None:
+            for landmark in landmarks:
+                self._add_landmark(landmark, expand_inbound)
+        else:
+            self._select_landmarks(min(landmark_count, graph.get_v()), random.Random(seed), expand_inbound)
+
+    def _add_landmark(self, landmark, expand_inbound) -> None:
+        """
+        Computes and stores the distance tables of one landmark.
+        :param expand_inbound: `graph.inbound_expander()` on directed graphs
+        """
+        self.graph.vertex_id(landmark)
+        self.landmarks.append(landmark)
+        forward = _distance_table(self.graph, landmark, self.graph.iter_neighbours)
+        self.from_landmark.append(forward)
+        if self.graph.is_directed:
+            self.to_landmark.append(_distance_table(self.graph, landmark, expand_inbound))
+        else:
+            self.to_landmark.append(forward)
+
+    def _select_landmarks(self, landmark_count: int, rng: random.Random, expand_inbound) -> None:
+        """
+        Farthest selection: every new landmark is the vertex whose distance to the
+        closest landmark already picked is the largest. Unreachable vertices count
+        as farthest, so every component gets a landmark.
+        """
+        vertices = self.graph.return_vertices_list()
+        closest = dict.fromkeys(vertices, float('inf'))
+        candidate = rng.choice(vertices)
+        while len(self.landmarks) < landmark_count:
+            self._add_landmark(candidate, expand_inbound)
+            for vertex, distance in self.from_landmark[-1].items():
+                closest[vertex] = min(closest[vertex], distance)
+            for vertex, distance in self.to_landmark[-1].items():
+                closest[vertex] = min(closest[vertex], distance)
+            chosen = set(self.landmarks)
+            candidate = max((vertex for vertex in vertices if vertex not in chosen),
+                            key=lambda vertex: closest[vertex], default=None)
+            if candidate is None:
+                break
+
+    def __call__(self, vertex, goal_vertex):
+        """
+        Returns an admissible lower bound of the distance from vertex to goal_vertex.
+        Time Complexity: O(K)
+        """
+        bound = 0
+        for forward, backward in zip(self.from_landmark, self.to_landmark):
+            from_vertex = forward.get(vertex)
+            from_goal = forward.get(goal_vertex)
+            if from_vertex is not None and from_goal is not None and from_goal - from_vertex > bound:
+                bound = from_goal - from_vertex
+            to_vertex = backward.get(vertex)
+            to_goal = backward.get(goal_vertex)
+            if to_vertex is not None and to_goal is not None and to_vertex - to_goal > bound:
+                bound = to_vertex - to_goal
+        return bound
+
+
+def run_a_star_analysis(graph, start_vertex, end_vertex, heuristic=None):
+    """
+    Prints the A* analysis
+    """
+    cost, path, timing, cost_calls, heap_pushes, heap_pops = a_star(graph, start_vertex, end_vertex, heuristic)
+
+    if not path:
+        print(f"No valid path found from {start_vertex} to {end_vertex}.")
+        return
+
+    print(f"Minimum cost walk from {start_vertex} to {end_vertex}:")
+    print(f"Cost: {cost}")
+    print(f"Path: {', '.join(map(str, path))}")
+    print(f"Time: {timing:.2f}ms")
+    print(f"Calls to cost (g.cost): {cost_calls}")
+    print(f"Priority queue operations:")
+    print(f"1.heappush (inserts ~ O(log V)): {heap_pushes}")
+    print(f"2.heappop (removals ~ O(log V)): {heap_pops}")
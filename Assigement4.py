@@ -1,19 +1,25 @@
-from domain import SimpleDirectedGraph
+import heapq
 import random
 
+from domain import SimpleDirectedGraph
+from disjoint_set import DisjointSet
+
 
 
 def is_connected(graph : SimpleDirectedGraph)->bool:
     """
     A function that checks whether the graph is connected before performing the
     Kruskal's Algorithm
-    Complexity : theta(v) - v nr of vertices
+    Complexity : theta(v) - v nr of vertices, O(1) for undirected graphs with track_components
     :param graph: `SimpleDirectedGraph`
     :return: `bool`
     """
 
     if not graph.graph_repo :
         raise ValueError("Graph is empty")
+    if graph.components is not None and not graph.is_directed :
+        # O(1) answer from the graph's connectivity index
+        return graph.is_connected()
     rand_vertex = random.choice(list(graph.graph_repo.keys()))
 
     iterator  = graph.bfs_iter(rand_vertex)
@@ -24,11 +30,18 @@ def is_connected(graph : SimpleDirectedGraph)->bool:
 
     return len(visited_vertices) == len(graph.graph_repo)
 
-def min_spanning_tree(graph :SimpleDirectedGraph) -> SimpleDirectedGraph :
+# Edge density (e / max possible edges) from which Prim is preferred over Kruskal
+DENSE_GRAPH_DENSITY = 0.25
+
+
+def min_spanning_tree(graph :SimpleDirectedGraph, algorithm : str = "auto") -> SimpleDirectedGraph :
     """
-    Complexity theta (v + e) - v(nr of vertices) , e (nr of edges)
-    :param graph:
-    :return:
+    Minimum spanning tree of a connected, undirected, weighted graph.
+    "auto" runs Prim on dense graphs and Kruskal on sparse ones.
+    Complexity : O(e log v) - v(nr of vertices) , e (nr of edges)
+    :param graph: `SimpleDirectedGraph`
+    :param algorithm: "auto", "kruskal" or "prim"
+    :return: `SimpleDirectedGraph`
     """
     if graph.is_directed :
         raise ValueError("Kruskal's algorithm requires an undirected graph")
@@ -37,49 +50,93 @@ def min_spanning_tree(graph :SimpleDirectedGraph) -> SimpleDirectedGraph :
     if not is_connected(graph) :
         raise ValueError("Graph should we connected")
 
-    sorted_edges = []
-    seen = set()
+    if algorithm == "auto" :
+        vertex_count = graph.get_v()
+        max_edges = vertex_count * (vertex_count - 1) // 2
+        algorithm = "prim" if max_edges and graph.get_e() / max_edges >= DENSE_GRAPH_DENSITY else "kruskal"
 
-    for v1 in graph.return_vertices_list() :
-        for v2 in graph.neighbours(v1) :
-            if (v1, v2) not in seen and (v2, v1) not in seen :
-                seen.add((v1, v2))
-                weight = graph.get_weight(v1, v2)
-                sorted_edges.append((v1, v2, weight))
+    if algorithm == "kruskal" :
+        return kruskal_mst(graph)
+    if algorithm == "prim" :
+        return prim_mst(graph)
+    raise ValueError(f"Unknown MST algorithm '{algorithm}', expected 'auto', 'kruskal' or 'prim'")
 
-    sorted_edges.sort(key = lambda x : x[2])
 
+def _empty_tree(graph : SimpleDirectedGraph) -> SimpleDirectedGraph :
+    """
+    Undirected weighted graph with the vertices of graph and no edges
+    """
     t = SimpleDirectedGraph()
     t.change_if_weighted()
 
     for vertex in graph.return_vertices_list() :
         t.add_vertex(vertex)
+    return t
 
-    forest  = [{v} for v in graph.return_vertices_list()]
 
-    def find_tree(vertex) :
-        for tree in forest :
-            if vertex in tree :
-                return tree
-        return None
+def kruskal_mst(graph : SimpleDirectedGraph) -> SimpleDirectedGraph :
+    """
+    Kruskal's algorithm on a disjoint-set forest
+    Complexity : O(e log e) - e (nr of edges)
+    :param graph: `SimpleDirectedGraph`
+    :return: `SimpleDirectedGraph`
+    """
+    sorted_edges = []
+    seen = set()
 
-    def make_union(tree1, tree2) :
-        forest.remove(tree1)
-        forest.remove(tree2)
-        forest.append(tree1.union(tree2))
+    for v1 in graph.return_vertices_list() :
+        seen.add(v1)
+        for v2, weight in graph.iter_neighbours(v1) :
+            # every undirected edge is listed from both ends, keep it once
+            if v2 not in seen :
+                sorted_edges.append((v1, v2, weight))
 
-    i = 0
-    while t.get_e() < len(graph.return_vertices_list()) -1 :
+    sorted_edges.sort(key = lambda x : x[2])
 
-        v1, v2, weight = sorted_edges[i]
-        tree_of_v1 = find_tree(v1)
-        tree_of_v2 = find_tree(v2)
+    t = _empty_tree(graph)
+    forest = DisjointSet(graph.return_vertices_list())
+    edges_needed = graph.get_v() - 1
+    edges_added = 0
 
-        if tree_of_v1 != tree_of_v2 :
+    for v1, v2, weight in sorted_edges :
+        if edges_added == edges_needed :
+            break
+        if forest.union(v1, v2) :
             t.add_edge(v1, v2, weight)
-            make_union(tree_of_v1, tree_of_v2)
+            edges_added += 1
+
+    return t
+
 
-        i += 1
+def prim_mst(graph : SimpleDirectedGraph) -> SimpleDirectedGraph :
+    """
+    Prim's algorithm with a lazy binary heap
+    Complexity : O(e log v) - v(nr of vertices) , e (nr of edges)
+    :param graph: `SimpleDirectedGraph`
+    :return: `SimpleDirectedGraph`
+    """
+    t = _empty_tree(graph)
+    vertices = graph.return_vertices_list()
+    if not vertices :
+        return t
+
+    in_tree = {vertices[0]}
+    heap = [(weight, index, vertices[0], v2)
+            for index, (v2, weight) in enumerate(graph.iter_neighbours(vertices[0]))]
+    heapq.heapify(heap)
+    # the running index breaks weight ties without comparing vertex labels
+    counter = len(heap)
+
+    while heap and len(in_tree) < len(vertices) :
+        weight, _, v1, v2 = heapq.heappop(heap)
+        if v2 in in_tree :
+            continue
+        in_tree.add(v2)
+        t.add_edge(v1, v2, weight)
+        for v3, next_weight in graph.iter_neighbours(v2) :
+            if v3 not in in_tree :
+                heapq.heappush(heap, (next_weight, counter, v2, v3))
+                counter += 1
 
     return t
 
@@ -101,7 +158,7 @@ def find_all_leaf_nodes(graph : SimpleDirectedGraph)->list :
     for current, _ in iterator :
         visited.add(current)
         child_count[current] = 0
-        for neighbour in graph.neighbours(current) :
+        for neighbour in graph.neighbours_view(current) :
             if neighbour not in parent_map :
                 parent_map[neighbour] = current
                 child_count[current] += 1
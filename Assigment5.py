@@ -1,36 +1,180 @@
-import random
-from collections import defaultdict
+from array import array
 
+from csr import CSRGraph
 from domain import SimpleDirectedGraph
 from Assigement4 import is_connected
 
+# Eulerian circuits and paths over an array (CSR) snapshot of the graph.
+# Every vertex keeps a cursor into its CSR row, so each arc is looked at a constant number
+# of times and the whole traversal runs in O(v + e), deterministically.
+
+def degree_counters(csr : CSRGraph) -> tuple :
+    """
+    Out- and in-degree of every vertex ID of a snapshot, self-loops included.
+    For undirected graphs both counters are the vertex degree.
+    Complexity : theta(v+e)
+    :param csr: `CSRGraph`
+    :return: `tuple` of two `array` indexed by vertex ID
+    """
+    offsets = csr.offsets
+    out_degree = array("q", (offsets[vertex + 1] - offsets[vertex] for vertex in range(len(offsets) - 1)))
+    if not csr.is_directed :
+        return out_degree, out_degree
+    in_degree = array("q", bytes(8 * len(out_degree)))
+    for target in csr.targets :
+        in_degree[target] += 1
+    return out_degree, in_degree
+
+
+def eulerian_start(csr : CSRGraph) :
+    """
+    Picks the start vertex ID of an Eulerian trail from the degree counters: the vertex
+    with one more outgoing than incoming edge (directed) or the first odd-degree vertex
+    (undirected) for a path, the first vertex with edges for a circuit.
+    Connectivity is not checked here.
+    Complexity : theta(v+e)
+    :param csr: `CSRGraph`
+    :return: `tuple` (start ID or None if the degrees rule out a trail, True for a circuit)
+    """
+    out_degree, in_degree = degree_counters(csr)
+    first = None
+    starts = []
+    ends = 0
+    for vertex in range(len(out_degree)) :
+        if first is None and out_degree[vertex] :
+            first = vertex
+        if csr.is_directed :
+            balance = out_degree[vertex] - in_degree[vertex]
+            if balance == 1 :
+                starts.append(vertex)
+            elif balance == -1 :
+                ends += 1
+            elif balance :
+                return None, False
+        elif out_degree[vertex] % 2 :
+            starts.append(vertex)
+
+    if not starts and not ends :
+        return first, True
+    if csr.is_directed and len(starts) == 1 and ends == 1 :
+        return starts[0], False
+    if not csr.is_directed and len(starts) == 2 :
+        return starts[0], False
+    return None, False
+
+
+def _undirected_edge_ids(csr : CSRGraph) -> array :
+    """
+    Gives both arcs of every undirected edge the same edge ID, so an edge used in one
+    direction is skipped in the other. Arcs are paired by their unordered endpoint pair;
+    parallel arcs between the same two vertices may be paired with each other, which
+    still covers every edge exactly once.
+    Complexity : theta(v+e)
+    """
+    offsets = csr.offsets
+    targets = csr.targets
+    vertex_count = len(offsets) - 1
+    edge_ids = array("q", bytes(8 * len(targets)))
+    pending = {}
+    next_id = 0
+    for vertex in range(vertex_count) :
+        for position in range(offsets[vertex], offsets[vertex + 1]) :
+            target = targets[position]
+            key = vertex * vertex_count + target if vertex <= target else target * vertex_count + vertex
+            edge_id = pending.pop(key, None)
+            if edge_id is None :
+                edge_id = pending[key] = next_id
+                next_id += 1
+            edge_ids[position] = edge_id
+    return edge_ids
+
+
+def find_eulerian_trail(graph, start=None) -> list :
+    """
+    Iterative Hierholzer algorithm: returns an Eulerian circuit when every vertex is
+    balanced (even degree for undirected graphs), otherwise an Eulerian path, as a list
+    of vertex labels. Vertices without edges are ignored.
+    :param graph: `SimpleDirectedGraph` or `CSRGraph` snapshot
+    :param start: optional start vertex label, by default picked from the degree counters
+    :return: `list`, empty if the graph has no Eulerian trail (or no trail from start)
+    Complexity : theta(v+e)
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    if not csr.get_v() :
+        return []
+    if not len(csr.targets) :
+        return [csr.labels[csr.vertex_id(start)] if start is not None else csr.labels[0]]
+    start_id, is_circuit = eulerian_start(csr)
+    if start_id is None :
+        return []
+    if start is not None :
+        requested = csr.vertex_id(start)
+        if is_circuit :
+            valid = csr.out_degree(requested) > 0
+        elif csr.is_directed :
+            valid = requested == start_id
+        else :
+            # an undirected path can start at either odd-degree vertex
+            valid = csr.out_degree(requested) % 2 == 1
+        if not valid :
+            return []
+        start_id = requested
+
+    offsets = csr.offsets
+    targets = csr.targets
+    arc_count = len(targets)
+    cursor = array("q", offsets[:-1])
+    edge_ids = None if csr.is_directed else _undirected_edge_ids(csr)
+    used = None if csr.is_directed else bytearray(arc_count // 2)
+
+    trail = []
+    stack = [start_id]
+    while stack :
+        vertex = stack[-1]
+        position = cursor[vertex]
+        end = offsets[vertex + 1]
+        if used is not None :
+            while position < end and used[edge_ids[position]] :
+                position += 1
+        if position < end :
+            cursor[vertex] = position + 1
+            if used is not None :
+                used[edge_ids[position]] = 1
+            stack.append(targets[position])
+        else :
+            cursor[vertex] = position
+            trail.append(stack.pop())
+
+    edge_count = arc_count if csr.is_directed else arc_count // 2
+    if len(trail) != edge_count + 1 :
+        # some edges are not reachable from the start vertex
+        return []
+    labels = csr.labels
+    return [labels[vertex] for vertex in reversed(trail)]
+
+
 #Funnction to check whether a graph is Eulerian
 
 def check_if_eul(graph : SimpleDirectedGraph)->bool :
     """
     Checks if a graph is eulerian
-    Complexity : Theta(v) v- nr of vertices
+    Complexity : theta(v+e) - the in-degrees come from one pass over a CSR snapshot
     :param graph: `SimpleDirectedGraph`
     :return: `bool`
     """
     if not is_connected(graph) :
         return False
-    if graph.is_directed :
-        is_eul = True
-        for vertex in graph.return_vertices_list() :
-            if len(graph.neighbours(vertex)) != len(graph.inbound_neighbours(vertex)) :
-                is_eul = False
-                break
+    return _balanced(graph.to_csr())
 
-        return is_eul
-    else :
-        is_eul = True
-        for vertex in graph.return_vertices_list() :
-            if len(graph.neighbours(vertex)) % 2 != 0 :
-                is_eul = False
-                break
 
-        return is_eul
+def _balanced(csr : CSRGraph) -> bool :
+    """
+    Degree condition of an Eulerian circuit: in-degree equal to out-degree, or even degrees.
+    """
+    out_degree, in_degree = degree_counters(csr)
+    if csr.is_directed :
+        return out_degree == in_degree
+    return all(degree % 2 == 0 for degree in out_degree)
 
 
 
@@ -38,42 +182,31 @@ def check_if_eul(graph : SimpleDirectedGraph)->bool :
 
 def get_eul_circuit(graph: SimpleDirectedGraph)->list :
     """
-    Function to compute an Eulerian circuit using the Hierholzer algorithm
+    Function to compute an Eulerian circuit using the Hierholzer algorithm,
+    starting from the first vertex that has edges
     :param graph: `SimpleDirectedGraph`
     :return: `list`
     Complexity : theta(v+e)
     """
 
-    if not check_if_eul(graph) :
+    if not is_connected(graph) :
         return []
-    result = []
-    neighbours = defaultdict(set)
-
-    for vertex in graph.return_vertices_list() :
-        neighbours[vertex] = set()
-
-    for vertex in graph.return_vertices_list() :
-        for node in graph.neighbours(vertex) :
-            if node not in neighbours[vertex] :
-                neighbours[vertex].add(node)
-            if not graph.is_directed and vertex not in neighbours[node]:
-                neighbours[node].add(vertex)
+    csr = graph.to_csr()
+    if not _balanced(csr) :
+        return []
+    return find_eulerian_trail(csr)
 
-    start = '6'
-    stack = [start]
 
-    while stack :
-        current  = stack[-1]
-        if neighbours[current] :
-            v = random.choice(list(neighbours[current]))
-            neighbours[current].remove(v)
-            if not graph.is_directed :
-                neighbours[v].remove(current)
-            stack.append(v)
-        else :
-            result.append(stack.pop())
-
-    return result[::-1]
+def get_eul_path(graph: SimpleDirectedGraph)->list :
+    """
+    Eulerian path of a graph that has one, starting from the vertex with an extra
+    outgoing edge (directed) or the first odd-degree vertex (undirected).
+    An Eulerian circuit is returned if the graph has one
+    :param graph: `SimpleDirectedGraph`
+    :return: `list`
+    Complexity : theta(v+e)
+    """
+    return find_eulerian_trail(graph)
 
 
 
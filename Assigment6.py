@@ -1,5 +1,13 @@
+import time
+
+from bitset import edge_density, iter_bits
 from domain import SimpleDirectedGraph
 
+# Edge density from which the clique and triangle routines switch to the graph's bitset adjacency.
+# Bitsets take V^2 / 8 bytes, so very large sparse graphs stay on neighbour sets.
+DENSE_GRAPH_DENSITY = 0.1
+
+
 def find_maximum_cliques_backtracking(graph):
     """
     This algorithm finds all the maximum cliques from a graph
@@ -11,13 +19,18 @@ def find_maximum_cliques_backtracking(graph):
         raise ValueError("Clique detection only applies to undirected graphs.")
 
     vertices = list(graph.return_vertices_list())  # Vertices can be '1', 'apple', 'Zebra', etc.
+    bits = graph.to_bitset() if edge_density(graph) >= DENSE_GRAPH_DENSITY else None
+    # O(1) membership tests on the sparse path
+    adjacency = _adjacency_sets(graph) if bits is None else None
     max_cliques = []
     max_size = 0
 
     def is_clique(candidate):
+        if bits is not None:
+            return bits.is_clique([graph.vertex_ids[vertex] for vertex in candidate])
         for i in range(len(candidate)):
             for j in range(i + 1, len(candidate)):
-                if candidate[j] not in graph.neighbours(candidate[i]):
+                if candidate[j] not in adjacency[candidate[i]]:
                     return False
         return True
 
@@ -39,10 +52,301 @@ def find_maximum_cliques_backtracking(graph):
     return max_cliques
 
 
+class _BudgetExhausted(Exception):
+    """
+    Raised inside the clique search when the time or node budget runs out.
+    """
+
+
+def _adjacency_sets(graph) -> dict:
+    """
+    Neighbour sets without self-loops, built once for the whole search.
+    """
+    return {vertex: set(graph.neighbours_view(vertex)) - {vertex} for vertex in graph.return_vertices_list()}
+
+
+def degeneracy_ordering(adjacency : dict) -> list:
+    """
+    Orders the vertices by repeatedly removing one of minimum remaining degree.
+    Complexity : O(v + e)
+    :param adjacency: vertex -> set of neighbours
+    :return: `list`
+    """
+    degrees = {vertex: len(neighbours) for vertex, neighbours in adjacency.items()}
+    buckets = [set() for _ in range(max(degrees.values(), default=0) + 1)]
+    for vertex, degree in degrees.items():
+        buckets[degree].add(vertex)
+
+    order = []
+    removed = set()
+    lowest = 0
+    for _ in range(len(adjacency)):
+        lowest = max(lowest - 1, 0)
+        while not buckets[lowest]:
+            lowest += 1
+        vertex = buckets[lowest].pop()
+        order.append(vertex)
+        removed.add(vertex)
+        for neighbour in adjacency[vertex]:
+            if neighbour not in removed:
+                buckets[degrees[neighbour]].remove(neighbour)
+                degrees[neighbour] -= 1
+                buckets[degrees[neighbour]].add(neighbour)
+    return order
+
+
+def _bitset_adjacency(bits) -> dict:
+    """
+    Vertex ID -> set of neighbour IDs, for the degeneracy ordering of a bitset search.
+    """
+    return {vertex_id: set(iter_bits(row)) for vertex_id, row in enumerate(bits.rows)
+            if bits.labels[vertex_id] is not None}
+
+
+def _colour_bound(candidates : set, adjacency : dict) -> int:
+    """
+    Number of colours of a greedy colouring of the candidates, an upper bound
+    on the size of any clique among them.
+    """
+    colour_classes = []
+    for vertex in sorted(candidates, key=lambda v: -len(adjacency[v] & candidates)):
+        neighbours = adjacency[vertex]
+        for colour_class in colour_classes:
+            if not neighbours & colour_class:
+                colour_class.add(vertex)
+                break
+        else:
+            colour_classes.append({vertex})
+    return len(colour_classes)
+
+
+def _colour_bound_bits(candidates : int, rows) -> int:
+    """
+    Bitset version of `_colour_bound`: greedily peels off one independent set per colour.
+    """
+    colours = 0
+    uncoloured = candidates
+    while uncoloured:
+        colours += 1
+        available = uncoloured
+        while available:
+            lowest = available & -available
+            uncoloured ^= lowest
+            available &= ~(lowest | rows[lowest.bit_length() - 1])
+    return colours
+
+
+def find_maximal_cliques(graph):
+    """
+    Enumerates every maximal clique with Bron-Kerbosch, Tomita pivoting and
+    a degeneracy ordering of the outer loop.
+    Complexity : O(d * n * 3^(d/3)) - d degeneracy of the graph
+    :param graph: `SimpleDirectedGraph`
+    :return: generator of `list`
+    """
+    if graph.is_directed:
+        raise ValueError("Clique detection only applies to undirected graphs.")
+
+    if edge_density(graph) >= DENSE_GRAPH_DENSITY:
+        yield from _maximal_cliques_bitset(graph.to_bitset())
+        return
+
+    adjacency = _adjacency_sets(graph)
+
+    def expand(clique, candidates, excluded):
+        if not candidates and not excluded:
+            yield clique[:]
+            return
+        pivot = max(candidates | excluded, key=lambda u: len(candidates & adjacency[u]))
+        for vertex in list(candidates - adjacency[pivot]):
+            clique.append(vertex)
+            yield from expand(clique, candidates & adjacency[vertex], excluded & adjacency[vertex])
+            clique.pop()
+            candidates.remove(vertex)
+            excluded.add(vertex)
+
+    done = set()
+    for vertex in degeneracy_ordering(adjacency):
+        neighbours = adjacency[vertex]
+        yield from expand([vertex], neighbours - done, neighbours & done)
+        done.add(vertex)
+
+
+def _maximal_cliques_bitset(bits):
+    """
+    `find_maximal_cliques` over a `BitsetAdjacency`: candidate and excluded sets are bitsets.
+    """
+    rows = bits.rows
+    labels = bits.labels
+
+    def expand(clique, candidates, excluded):
+        if not candidates and not excluded:
+            yield [labels[vertex_id] for vertex_id in clique]
+            return
+        pivot = max(iter_bits(candidates | excluded), key=lambda u: (candidates & rows[u]).bit_count())
+        for vertex_id in iter_bits(candidates & ~rows[pivot]):
+            bit = 1 << vertex_id
+            clique.append(vertex_id)
+            yield from expand(clique, candidates & rows[vertex_id], excluded & rows[vertex_id])
+            clique.pop()
+            candidates &= ~bit
+            excluded |= bit
+
+    done = 0
+    for vertex_id in degeneracy_ordering(_bitset_adjacency(bits)):
+        row = rows[vertex_id]
+        yield from expand([vertex_id], row & ~done, row & done)
+        done |= 1 << vertex_id
+
+
+def find_maximum_cliques(graph, use_colouring_bound : bool = True, time_budget : float = None,
+                         node_budget : int = None, stats : dict = None) -> list:
+    """
+    Finds all the maximum cliques with Bron-Kerbosch (Tomita pivoting, degeneracy
+    ordering) and branch and bound: a branch is cut when the clique so far plus a
+    greedy colouring bound of the candidates cannot reach the best size found.
+    Dense graphs are searched over the graph's bitset adjacency.
+    Returns the same list of cliques as `find_maximum_cliques_backtracking`.
+    When a budget runs out the best cliques found so far are returned.
+    Complexity : O(d * n * 3^(d/3)) worst case, far less with the colouring bound
+    :param graph: `SimpleDirectedGraph`
+    :param use_colouring_bound: prune with the greedy colouring bound
+    :param time_budget: optional limit in seconds
+    :param node_budget: optional limit on the number of search nodes
+    :param stats: optional dict that receives the node count and whether a budget ran out
+    :return: `list`
+    """
+    if graph.is_directed:
+        raise ValueError("Clique detection only applies to undirected graphs.")
+
+    position = {vertex: index for index, vertex in enumerate(graph.return_vertices_list())}
+    max_cliques = [[]]
+    max_size = 0
+    nodes = 0
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+
+    def visit(clique) -> None:
+        nonlocal nodes
+        nodes += 1
+        if node_budget is not None and nodes > node_budget:
+            raise _BudgetExhausted()
+        if deadline is not None and nodes % 1024 == 0 and time.perf_counter() > deadline:
+            raise _BudgetExhausted()
+
+    def record(clique) -> None:
+        nonlocal max_cliques, max_size
+        if len(clique) > max_size:
+            max_cliques = [clique[:]]
+            max_size = len(clique)
+        elif len(clique) == max_size:
+            max_cliques.append(clique[:])
+
+    def expand(clique, candidates, excluded):
+        visit(clique)
+        if not candidates:
+            if not excluded:
+                record(clique)
+            return
+        if len(clique) + len(candidates) < max_size:
+            return
+        if use_colouring_bound and len(clique) + _colour_bound(candidates, adjacency) < max_size:
+            return
+
+        pivot = max(candidates | excluded, key=lambda u: len(candidates & adjacency[u]))
+        for vertex in list(candidates - adjacency[pivot]):
+            clique.append(vertex)
+            expand(clique, candidates & adjacency[vertex], excluded & adjacency[vertex])
+            clique.pop()
+            candidates.remove(vertex)
+            excluded.add(vertex)
+
+    def expand_bits(clique, candidates, excluded):
+        visit(clique)
+        if not candidates:
+            if not excluded:
+                record([labels[vertex_id] for vertex_id in clique])
+            return
+        if len(clique) + candidates.bit_count() < max_size:
+            return
+        if use_colouring_bound and len(clique) + _colour_bound_bits(candidates, rows) < max_size:
+            return
+
+        pivot = max(iter_bits(candidates | excluded), key=lambda u: (candidates & rows[u]).bit_count())
+        for vertex_id in iter_bits(candidates & ~rows[pivot]):
+            bit = 1 << vertex_id
+            clique.append(vertex_id)
+            expand_bits(clique, candidates & rows[vertex_id], excluded & rows[vertex_id])
+            clique.pop()
+            candidates &= ~bit
+            excluded |= bit
+
+    exhausted = False
+    try:
+        # latest vertices in the degeneracy order first: their candidate sets are small
+        # and quickly give a good size bound for the rest of the search
+        if edge_density(graph) >= DENSE_GRAPH_DENSITY:
+            bits = graph.to_bitset()
+            rows = bits.rows
+            labels = bits.labels
+            done = 0
+            for vertex_id in reversed(degeneracy_ordering(_bitset_adjacency(bits))):
+                row = rows[vertex_id]
+                expand_bits([vertex_id], row & ~done, row & done)
+                done |= 1 << vertex_id
+        else:
+            adjacency = _adjacency_sets(graph)
+            done = set()
+            for vertex in reversed(degeneracy_ordering(adjacency)):
+                neighbours = adjacency[vertex]
+                expand([vertex], neighbours - done, neighbours & done)
+                done.add(vertex)
+    except _BudgetExhausted:
+        exhausted = True
+
+    if stats is not None:
+        stats["nodes"] = nodes
+        stats["budget_exhausted"] = exhausted
+
+    cliques = [sorted(clique, key=position.get) for clique in max_cliques]
+    cliques.sort(key=lambda clique: [position[vertex] for vertex in clique])
+    return cliques
+
+
+def count_triangles(graph) -> int:
+    """
+    Counts the triangles of an undirected graph. Every edge (u, v) with u before v
+    counts the common neighbours that come after v; dense graphs intersect bitsets
+    and count them by popcount.
+    Complexity : O(e * sqrt(e)) with sets, O(e * v / 64) with bitsets
+    :param graph: `SimpleDirectedGraph`
+    :return: `int`
+    """
+    if graph.is_directed:
+        raise ValueError("Triangle counting only applies to undirected graphs.")
+
+    if edge_density(graph) >= DENSE_GRAPH_DENSITY:
+        rows = graph.to_bitset().rows
+        triangles = 0
+        for vertex_id, row in enumerate(rows):
+            for neighbour_id in iter_bits(row >> (vertex_id + 1)):
+                neighbour_id += vertex_id + 1
+                triangles += ((row & rows[neighbour_id]) >> (neighbour_id + 1)).bit_count()
+        return triangles
+
+    # orient every edge towards the endpoint of higher (degree, ID) rank, so each
+    # triangle is found once and every forward set has O(sqrt(e)) vertices
+    adjacency = _adjacency_sets(graph)
+    rank = {vertex: (len(neighbours), graph.vertex_ids[vertex]) for vertex, neighbours in adjacency.items()}
+    forward = {vertex: {neighbour for neighbour in neighbours if rank[neighbour] > rank[vertex]}
+               for vertex, neighbours in adjacency.items()}
+    return sum(len(forward[vertex] & forward[neighbour])
+               for vertex, neighbours in forward.items() for neighbour in neighbours)
+
+
 if __name__ == "__main__" :
     my_graph = SimpleDirectedGraph.create_from_file('input.txt')
 
-    all_maximum_cliques = find_maximum_cliques_backtracking(my_graph)
+    all_maximum_cliques = find_maximum_cliques(my_graph)
 
     for clique in all_maximum_cliques :
         print(clique)
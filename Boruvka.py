@@ -0,0 +1,103 @@
+import os
+from multiprocessing.sharedctypes import RawArray
+
+from csr import CSRGraph, SnapshotPool
+from disjoint_set import DisjointSet
+from domain import SimpleDirectedGraph
+
+
+def _minimum_outgoing_edges(csr, components, vertex_range) -> dict:
+    """
+    Minimum-outgoing-edge phase over one vertex partition, run by `SnapshotPool`.
+    Edges are compared by (weight, smaller endpoint, larger endpoint), a strict total order,
+    so components never pick edges that close a cycle.
+    :param components: shared `RawArray` of component labels indexed by vertex ID
+    :return: `dict` component label -> (weight, vertex1, vertex2)
+    """
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+    components = memoryview(components).cast("B").cast("q")
+    best = {}
+    for vertex in range(*vertex_range):
+        component = components[vertex]
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[position]
+            if components[neighbor] == component:
+                continue
+            if vertex < neighbor:
+                candidate = (weights[position], vertex, neighbor)
+            else:
+                candidate = (weights[position], neighbor, vertex)
+            current = best.get(component)
+            if current is None or candidate < current:
+                best[component] = candidate
+    return best
+
+
+def _partitions(csr: CSRGraph, parts: int) -> list:
+    """
+    Splits the vertex IDs into contiguous ranges with about the same number of edges each.
+    """
+    vertex_count = csr.get_v()
+    edges_per_part = max(1, len(csr.targets) // parts)
+    ranges = []
+    start = 0
+    for vertex in range(vertex_count):
+        if csr.offsets[vertex + 1] - csr.offsets[start] >= edges_per_part:
+            ranges.append((start, vertex + 1))
+            start = vertex + 1
+    if start < vertex_count:
+        ranges.append((start, vertex_count))
+    return ranges
+
+
+def minimum_spanning_forest(graph: SimpleDirectedGraph, workers: int = None) -> SimpleDirectedGraph:
+    """
+    Boruvka's algorithm with a parallel minimum-outgoing-edge phase.
+    Every round, worker processes scan vertex partitions of a shared CSR snapshot and
+    report the cheapest edge leaving each component; the components are then merged
+    with a disjoint-set forest and the shared component labels are updated.
+    A disconnected input yields a minimum spanning forest instead of an error.
+    Complexity : O(e log v) work over O(log v) rounds
+    :param graph: undirected weighted `SimpleDirectedGraph`
+    :param workers: number of processes, defaults to the number of CPUs
+    :return: `SimpleDirectedGraph` forest with the same vertices
+    """
+    if graph.is_directed:
+        raise ValueError("Boruvka's algorithm requires an undirected graph")
+    if not graph.is_weighted:
+        raise ValueError("Boruvka's algorithm requires a weighted graph")
+
+    csr = graph.to_csr()
+    vertex_count = csr.get_v()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    forest = SimpleDirectedGraph()
+    forest.change_if_weighted()
+    for label in csr.labels:
+        forest.add_vertex(label)
+
+    components = RawArray("q", range(vertex_count))
+    merged = DisjointSet(range(vertex_count))
+    ranges = _partitions(csr, workers * 4)
+
+    with SnapshotPool(csr, workers if len(ranges) > 1 else 1, components) as pool:
+        while True:
+            cheapest = {}
+            for best in pool.map(_minimum_outgoing_edges, ranges):
+                for component, candidate in best.items():
+                    current = cheapest.get(component)
+                    if current is None or candidate < current:
+                        cheapest[component] = candidate
+            if not cheapest:
+                break
+
+            for weight, vertex1, vertex2 in cheapest.values():
+                if merged.union(vertex1, vertex2):
+                    forest.add_edge(csr.labels[vertex1], csr.labels[vertex2], weight)
+            for vertex in range(vertex_count):
+                components[vertex] = merged.find(vertex)
+
+    return forest
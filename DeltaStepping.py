@@ -0,0 +1,153 @@
+import os
+import time
+
+from csr import CSRGraph, SnapshotPool, label_results
+from Djkstra import get_walk
+
+
+def _relaxation_requests(csr, delta, task) -> tuple:
+    """
+    Scans the light (weight <= delta) or heavy edges out of a batch of vertices and keeps
+    the best candidate distance per target. Run by `SnapshotPool`.
+    :param task: `(vertex_ids, distances, light)` with the current distance of every vertex in the batch
+    :return: `tuple` (`dict` target -> (distance, parent), number of edges scanned)
+    """
+    vertex_ids, distances, light = task
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+    requests = {}
+    scanned = 0
+    for vertex, distance in zip(vertex_ids, distances):
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            weight = weights[position]
+            if (weight <= delta) != light:
+                continue
+            scanned += 1
+            candidate = distance + weight
+            target = targets[position]
+            current = requests.get(target)
+            if current is None or candidate < current[0]:
+                requests[target] = (candidate, vertex)
+    return requests, scanned
+
+
+def default_delta(csr: CSRGraph) -> float:
+    """
+    Bucket width heuristic: the largest edge weight over the average out-degree,
+    and never below the smallest edge weight.
+    :return: `float`
+    """
+    if not len(csr.weights):
+        return 1
+    average_degree = len(csr.targets) / max(1, csr.get_v())
+    return max(max(csr.weights) / average_degree, min(csr.weights), 1e-9)
+
+
+def delta_stepping(graph, start_vertex, delta: float = None, workers: int = None, batch_size: int = 1024):
+    """
+    Delta-stepping single-source shortest paths on non-negative weights.
+    Tentative distances are kept in buckets of width `delta`. The lowest non-empty bucket
+    is emptied repeatedly by relaxing the light edges (weight <= delta) of its vertices,
+    which may refill it; the heavy edges of every vertex removed from it are relaxed once
+    afterwards. Each batch of relaxations is split across a process pool that shares a
+    read-only CSR snapshot, through fork where available and otherwise through a
+    memory-mapped binary file. Batches smaller than `batch_size` vertices run in-process.
+    A small delta approaches Dijkstra (few re-relaxations, many buckets), a large one
+    approaches Bellman-Ford (few buckets, many re-relaxations).
+    Time Complexity: O(V + E) work per bucket phase, O((V + E) + L / delta) buckets for
+    maximum shortest-path length L
+    :param graph: weighted `SimpleDirectedGraph` or `CSRGraph`
+    :param start_vertex: start vertex label
+    :param delta: bucket width, `default_delta(snapshot)` by default
+    :param workers: number of processes, defaults to the number of CPUs
+    :param batch_size: vertices per worker task
+    :return: `tuple` (distances, previous_vertices, timing in ms, cost_calls,
+    buckets_processed, re_relaxations) with label-keyed dicts like `Djkstra.dijkstra`
+    """
+    if not graph.is_weighted:
+        raise ValueError("Delta-stepping requires a weighted graph.")
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    if len(csr.weights) and min(csr.weights) < 0:
+        raise ValueError("Delta-stepping requires non-negative edge weights.")
+    start_id = csr.vertex_id(start_vertex)
+    if delta is None:
+        delta = default_delta(csr)
+    if delta <= 0:
+        raise ValueError("Delta must be positive.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    vertex_count = csr.get_v()
+    distances = [float('inf')] * vertex_count
+    previous_vertices = [None] * vertex_count
+    distances[start_id] = 0
+    buckets = {0: {start_id}}
+
+    cost_calls = 0
+    buckets_processed = 0
+    re_relaxations = 0
+
+    start_time = time.time()
+    with SnapshotPool(csr, workers, delta) as pool:
+        def relax(vertices, light):
+            nonlocal cost_calls, re_relaxations
+            tasks = [(batch, [distances[vertex] for vertex in batch], light)
+                     for batch in (vertices[index:index + batch_size] for index in range(0, len(vertices), batch_size))]
+            for requests, scanned in pool.map(_relaxation_requests, tasks):
+                cost_calls += scanned
+                for target, (candidate, parent) in requests.items():
+                    current = distances[target]
+                    if candidate < current:
+                        if current != float('inf'):
+                            re_relaxations += 1
+                            # the bucket being emptied has already been popped
+                            bucket = buckets.get(int(current // delta))
+                            if bucket is not None:
+                                bucket.discard(target)
+                        distances[target] = candidate
+                        previous_vertices[target] = parent
+                        buckets.setdefault(int(candidate // delta), set()).add(target)
+
+        while buckets:
+            index = min(buckets)
+            if not buckets[index]:
+                del buckets[index]
+                continue
+            buckets_processed += 1
+            # vertices settled in this bucket, in order, each once
+            removed = {}
+            while buckets.get(index):
+                frontier = list(buckets.pop(index))
+                removed.update(dict.fromkeys(frontier))
+                relax(frontier, True)
+            buckets.pop(index, None)
+            relax(list(removed), False)
+
+    end_time = time.time()
+    timing = (end_time - start_time) * 1000
+
+    distance_map, previous_map = label_results(csr, distances, previous_vertices)
+    return distance_map, previous_map, timing, cost_calls, buckets_processed, re_relaxations
+
+
+def run_delta_stepping_analysis(graph, start_vertex, end_vertex, delta: float = None, workers: int = None):
+    """
+    Prints the delta-stepping analysis
+    """
+    distances, prev, timing, cost_calls, buckets_processed, re_relaxations = \
+        delta_stepping(graph, start_vertex, delta, workers)
+    path = get_walk(prev, start_vertex, end_vertex)
+
+    if not path:
+        print(f"No valid path found from {start_vertex} to {end_vertex}.")
+        return
+
+    print(f"Minimum cost walk from {start_vertex} to {end_vertex}:")
+    print(f"Cost: {distances[end_vertex]}")
+    print(f"Path: {', '.join(map(str, path))}")
+    print(f"Time: {timing:.2f}ms")
+    print(f"Calls to cost (g.cost): {cost_calls}")
+    print(f"Buckets processed: {buckets_processed}")
+    print(f"Re-relaxations: {re_relaxations}")
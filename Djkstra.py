@@ -1,18 +1,96 @@
 import heapq
+import os
 import time
 
-def dijkstra(graph, start_vertex):
+from csr import CSRGraph, SnapshotPool, label_results
+from instrumentation import phase, report
+from priority_queues import make_queue
+
+def dijkstra(graph, start_vertex, metrics=None, queue="heap"):
     """
     Dijkstra cost walk on a weighted graph
+    Runs over the graph's CSR snapshot (`to_csr`, cached until the graph changes) with
+    flat lists indexed by vertex ID, and returns distances and previous vertices as
+    dicts keyed by vertex label.
     Time Complexity: O((V + E) log V)
+    :param graph: `SimpleDirectedGraph` or `CSRGraph`
+    :param metrics: optional `instrumentation.SearchMetrics`
+    :param queue: priority queue backend, see `priority_queues.make_queue`
     """
     if not graph.is_weighted:
         raise ValueError("Dijkstra's algorithm requires a weighted graph.")
 
-    distances = {vertex: float('inf') for vertex in graph.return_vertices_list()}
-    distances[start_vertex] = 0
-    priority_queue = [(0, start_vertex)]
-    previous_vertices = {vertex: None for vertex in graph.return_vertices_list()}
+    with phase(metrics, "snapshot"):
+        csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    start_id = csr.vertex_id(start_vertex)
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+
+    distances = [float('inf')] * csr.get_v()
+    distances[start_id] = 0
+    priority_queue = make_queue(queue, csr)
+    push = priority_queue.push
+    pop = priority_queue.pop
+    push((0, start_id))
+    previous_vertices = [None] * csr.get_v()
+
+    cost_calls = 0
+    heap_pushes = 0
+    heap_pops = 0
+
+    record_frontier = metrics.frontier_recorder() if metrics is not None else None
+    start_time = time.time()
+
+    with phase(metrics, "search"):
+        while priority_queue:
+            current_distance, current_vertex = pop()
+            heap_pops += 1
+            if record_frontier is not None:
+                record_frontier(len(priority_queue))
+
+            if current_distance > distances[current_vertex]:
+                continue
+
+            for position in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                cost_calls += 1
+                neighbor = targets[position]
+                distance = current_distance + weights[position]
+
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous_vertices[neighbor] = current_vertex
+                    push((distance, neighbor))
+                    heap_pushes += 1
+
+    end_time = time.time()
+    timing = (end_time - start_time) * 1000
+
+    with phase(metrics, "results"):
+        distances, previous_vertices = label_results(csr, distances, previous_vertices)
+    report(metrics, cost_calls, heap_pushes, heap_pops)
+    return distances, previous_vertices, timing, cost_calls, heap_pushes, heap_pops
+
+
+def dijkstra_csr(csr, start_id):
+    """
+    Dijkstra cost walk on a frozen CSRGraph snapshot.
+    Vertices are integer IDs; distances and previous vertices are lists indexed by ID.
+    Time Complexity: O((V + E) log V)
+    """
+    if not csr.is_weighted:
+        raise ValueError("Dijkstra's algorithm requires a weighted graph.")
+    if not 0 <= start_id < csr.get_v():
+        raise ValueError(f"Start vertex ID {start_id} is not in the graph.")
+
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+
+    distances = [float('inf')] * csr.get_v()
+    distances[start_id] = 0
+    priority_queue = [(0, start_id)]
+    previous_vertices = [None] * csr.get_v()
 
     cost_calls = 0
     heap_pushes = 0
@@ -27,10 +105,10 @@ def dijkstra(graph, start_vertex):
         if current_distance > distances[current_vertex]:
             continue
 
-        for neighbor in graph.neighbours(current_vertex):#Complexity for neighbours->0(v)
+        for position in range(offsets[current_vertex], offsets[current_vertex + 1]):
             cost_calls += 1
-            edge_weight = graph.get_weight(current_vertex, neighbor)#Complexity for get_weight->theta(1)
-            distance = current_distance + edge_weight
+            neighbor = targets[position]
+            distance = current_distance + weights[position]
 
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
@@ -44,6 +122,116 @@ def dijkstra(graph, start_vertex):
     return distances, previous_vertices, timing, cost_calls, heap_pushes, heap_pops
 
 
+def _labelled_dijkstra(csr, _state, source_id):
+    """
+    Runs dijkstra_csr on the given snapshot and labels the result, run by `SnapshotPool`.
+    :return: `tuple` (source label, distances, previous_vertices) with label-keyed dicts
+    """
+    distances, previous_vertices = dijkstra_csr(csr, source_id)[:2]
+    return (csr.labels[source_id],) + label_results(csr, distances, previous_vertices)
+
+
+def dijkstra_many(graph, sources, workers=None, chunksize=1):
+    """
+    Runs Dijkstra from many source vertices across a process pool.
+    The graph is frozen once into a read-only CSR snapshot that workers share, through
+    fork where available and otherwise through a memory-mapped binary file, so the
+    graph is never pickled per task.
+    Results are streamed back as they complete, in no particular order.
+    Time Complexity: O(S (V + E) log V / workers) for S sources
+    :param graph: `SimpleDirectedGraph` or `CSRGraph`
+    :param sources: iterable of source vertex labels
+    :param workers: number of processes, defaults to the number of CPUs
+    :param chunksize: number of sources handed to a worker at a time
+    :return: generator of `(source, distances, previous_vertices)` with label-keyed dicts
+    """
+    if not graph.is_weighted:
+        raise ValueError("Dijkstra's algorithm requires a weighted graph.")
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    source_ids = [csr.vertex_id(source) for source in sources]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # with one worker the searches run in-process on the local snapshot
+    with SnapshotPool(csr, workers if len(source_ids) > 1 else 1) as pool:
+        yield from pool.map(_labelled_dijkstra, source_ids, chunksize)
+
+
+def bidirectional_dijkstra(graph, start_vertex, end_vertex):
+    """
+    Point-to-point Dijkstra that searches forward from start_vertex and backward
+    from end_vertex (over inbound edges on directed graphs), and stops when the two
+    frontiers meet. Directed graphs built without `track_inbound=True` get a reverse
+    adjacency built once per query, which costs O(V + E) up front.
+    Time Complexity: O((V + E) log V), usually settling far fewer vertices than `dijkstra`
+    :return: distance (inf when unreachable), path, timing, cost_calls, heap_pushes, heap_pops
+    """
+    if not graph.is_weighted:
+        raise ValueError("Dijkstra's algorithm requires a weighted graph.")
+    graph.vertex_id(start_vertex)
+    graph.vertex_id(end_vertex)
+
+    # index 0 is the forward search, index 1 the backward search
+    distances = ({start_vertex: 0}, {end_vertex: 0})
+    previous_vertices = ({start_vertex: None}, {end_vertex: None})
+    settled = (set(), set())
+    priority_queues = ([(0, start_vertex)], [(0, end_vertex)])
+    # built once per query: without the incoming-edge index every inbound lookup would scan the whole graph
+    expand = (graph.iter_neighbours, graph.inbound_expander())
+
+    best_distance = float('inf')
+    meeting_vertex = start_vertex if start_vertex == end_vertex else None
+    if meeting_vertex is not None:
+        best_distance = 0
+
+    cost_calls = 0
+    heap_pushes = 0
+    heap_pops = 0
+
+    start_time = time.time()
+
+    while priority_queues[0] and priority_queues[1]:
+        if priority_queues[0][0][0] + priority_queues[1][0][0] >= best_distance:
+            break
+
+        side = 0 if priority_queues[0][0][0] <= priority_queues[1][0][0] else 1
+        current_distance, current_vertex = heapq.heappop(priority_queues[side])
+        heap_pops += 1
+
+        if current_vertex in settled[side]:
+            continue
+        settled[side].add(current_vertex)
+
+        own_distances = distances[side]
+        other_distances = distances[1 - side]
+        for neighbor, edge_weight in expand[side](current_vertex):
+            cost_calls += 1
+            distance = current_distance + edge_weight
+
+            if distance < own_distances.get(neighbor, float('inf')):
+                own_distances[neighbor] = distance
+                previous_vertices[side][neighbor] = current_vertex
+                heapq.heappush(priority_queues[side], (distance, neighbor))
+                heap_pushes += 1
+
+            if neighbor in other_distances and distance + other_distances[neighbor] < best_distance:
+                best_distance = distance + other_distances[neighbor]
+                meeting_vertex = neighbor
+
+    end_time = time.time()
+    timing = (end_time - start_time) * 1000
+
+    path = []
+    if meeting_vertex is not None:
+        path = get_walk(previous_vertices[0], start_vertex, meeting_vertex)
+        current_vertex = previous_vertices[1][meeting_vertex]
+        while current_vertex is not None:
+            path.append(current_vertex)
+            current_vertex = previous_vertices[1][current_vertex]
+
+    return best_distance, path, timing, cost_calls, heap_pushes, heap_pops
+
 
 def get_walk(previous_vertices, start_vertex, end_vertex):
     """
@@ -66,19 +254,24 @@ def get_walk(previous_vertices, start_vertex, end_vertex):
         return []
 
 
-def run_dijkstra_analysis(graph, start_vertex, end_vertex):
+def run_dijkstra_analysis(graph, start_vertex, end_vertex, bidirectional=False):
     """
     Prints the Dijkstra analysis
+    :param bidirectional: use `bidirectional_dijkstra` instead of the full single-source search
     """
-    distances, prev, timing, cost_calls, heap_pushes, heap_pops = dijkstra(graph, start_vertex)
-    path = get_walk(prev, start_vertex, end_vertex)
+    if bidirectional:
+        cost, path, timing, cost_calls, heap_pushes, heap_pops = bidirectional_dijkstra(graph, start_vertex, end_vertex)
+    else:
+        distances, prev, timing, cost_calls, heap_pushes, heap_pops = dijkstra(graph, start_vertex)
+        path = get_walk(prev, start_vertex, end_vertex)
+        cost = distances[end_vertex]
 
     if not path:
         print(f"No valid path found from {start_vertex} to {end_vertex}.")
         return
 
     print(f"Minimum cost walk from {start_vertex} to {end_vertex}:")
-    print(f"Cost: {distances[end_vertex]}")
+    print(f"Cost: {cost}")
     print(f"Path: {', '.join(map(str, path))}")
     print(f"Time: {timing:.2f}ms")
     print(f"Calls to cost (g.cost): {cost_calls}")
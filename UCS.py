@@ -1,18 +1,80 @@
 import heapq
 import time
 
-def uniform_cost_search(graph, start, goal=None):
+from instrumentation import phase, report
+from priority_queues import make_queue
+
+def uniform_cost_search(graph, start, goal=None, metrics=None, queue="heap"):
     """
     Uniform Cost Search walk on a weighted graph.
     Stops early if goal is reached.
     O((V+E)logV)
+    :param metrics: optional `instrumentation.SearchMetrics`
+    :param queue: priority queue backend, see `priority_queues.make_queue`
     """
     distance = {v: float('inf') for v in graph.graph_repo}
     previous = {v: None for v in graph.graph_repo}
 
     distance[start] = 0
+    pq = make_queue(queue, graph)
+    pq.push((0, start))
+
+    cost_calls = 0
+    heap_pushes = 1
+    heap_pops = 0
+
+    record_frontier = metrics.frontier_recorder() if metrics is not None else None
+    start_time = time.time()
+
+    with phase(metrics, "search"):
+        while pq:
+            current_dist, current_node = pq.pop()
+            heap_pops += 1
+            if record_frontier is not None:
+                record_frontier(len(pq))
+
+            if goal is not None and current_node == goal:
+                break
+
+            for neighbor, weight in graph.graph_weight_repo[current_node].items():
+                cost_calls += 1
+                new_dist = current_dist + weight
+
+                if new_dist < distance[neighbor]:
+                    distance[neighbor] = new_dist
+                    previous[neighbor] = current_node
+                    pq.push((new_dist, neighbor))
+                    heap_pushes += 1
+
+    end_time = time.time()
+    execution_time = (end_time - start_time) * 1000  # in milliseconds
+
+    report(metrics, cost_calls, heap_pushes, heap_pops)
+    return distance, previous, execution_time, cost_calls, heap_pushes, heap_pops
+
+
+def uniform_cost_search_csr(csr, start_id, goal_id=None):
+    """
+    Uniform Cost Search walk on a frozen CSRGraph snapshot.
+    Vertices are integer IDs; distance and previous are lists indexed by ID.
+    Stops early if goal is reached.
+    O((V+E)logV)
+    """
+    if not csr.is_weighted:
+        raise ValueError("UCS requires a weighted graph.")
+    if not 0 <= start_id < csr.get_v():
+        raise ValueError(f"Start vertex ID {start_id} is not in the graph.")
+
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+
+    distance = [float('inf')] * csr.get_v()
+    previous = [None] * csr.get_v()
+
+    distance[start_id] = 0
     pq = []
-    heapq.heappush(pq, (0, start))
+    heapq.heappush(pq, (0, start_id))
 
     cost_calls = 0
     heap_pushes = 1
@@ -24,12 +86,13 @@ def uniform_cost_search(graph, start, goal=None):
         current_dist, current_node = heapq.heappop(pq)
         heap_pops += 1
 
-        if goal is not None and current_node == goal:
+        if goal_id is not None and current_node == goal_id:
             break
 
-        for neighbor, weight in graph.graph_weight_repo[current_node].items():
+        for position in range(offsets[current_node], offsets[current_node + 1]):
             cost_calls += 1
-            new_dist = current_dist + weight
+            neighbor = targets[position]
+            new_dist = current_dist + weights[position]
 
             if new_dist < distance[neighbor]:
                 distance[neighbor] = new_dist
@@ -1,9 +1,13 @@
-import heapq
 import time
 
-def uniform_cost_search(graph, start_vertex, goal_vertex):
+from instrumentation import phase, report
+from priority_queues import make_queue
+
+def uniform_cost_search(graph, start_vertex, goal_vertex, metrics=None, queue="heap"):
     """
     Uniform Cost Search (UCS) on a weighted graph.
+    :param metrics: optional `instrumentation.SearchMetrics`
+    :param queue: priority queue backend, see `priority_queues.make_queue`
     """
     if not graph.is_weighted:
         raise ValueError("UCS requires a weighted graph.")
@@ -12,36 +16,41 @@ def uniform_cost_search(graph, start_vertex, goal_vertex):
     distances[start_vertex] = 0
     previous_vertices = {vertex: None for vertex in graph.return_vertices_list()}
 
-    priority_queue = [(0, start_vertex)]
+    priority_queue = make_queue(queue, graph)
+    priority_queue.push((0, start_vertex))
 
     cost_calls = 0
     heap_pushes = 0
     heap_pops = 0
 
+    record_frontier = metrics.frontier_recorder() if metrics is not None else None
     start_time = time.time()
 
-    while priority_queue:
-        current_cost, current_vertex = heapq.heappop(priority_queue)
-        heap_pops += 1
+    with phase(metrics, "search"):
+        while priority_queue:
+            current_cost, current_vertex = priority_queue.pop()
+            heap_pops += 1
+            if record_frontier is not None:
+                record_frontier(len(priority_queue))
 
-        if current_cost > distances[current_vertex]:
-            continue
+            if current_cost > distances[current_vertex]:
+                continue
 
-        # Explore neighbors
-        for neighbor in graph.neighbours(current_vertex):
-            cost_calls += 1
-            edge_weight = graph.get_weight(current_vertex, neighbor)
-            new_cost = current_cost + edge_weight
+            # Explore neighbors
+            for neighbor, edge_weight in graph.iter_neighbours(current_vertex):
+                cost_calls += 1
+                new_cost = current_cost + edge_weight
 
-            if new_cost < distances[neighbor]:
-                distances[neighbor] = new_cost
-                previous_vertices[neighbor] = current_vertex
-                heapq.heappush(priority_queue, (new_cost, neighbor))
-                heap_pushes += 1
+                if new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    previous_vertices[neighbor] = current_vertex
+                    priority_queue.push((new_cost, neighbor))
+                    heap_pushes += 1
 
     end_time = time.time()
     timing = (end_time - start_time) * 1000  # Time in milliseconds
 
+    report(metrics, cost_calls, heap_pushes, heap_pops)
     return distances, previous_vertices, timing, cost_calls, heap_pushes, heap_pops
 
 def get_walk(previous_vertices, start_vertex, end_vertex):
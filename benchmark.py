@@ -0,0 +1,275 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+from domain import SimpleDirectedGraph
+from Djkstra import dijkstra
+from DeltaStepping import delta_stepping
+import UCS
+import UCS2
+from Assigement4 import min_spanning_tree
+from Assigment5 import get_eul_circuit
+from Assigment6 import count_triangles, find_maximum_cliques, find_maximum_cliques_backtracking
+
+
+# Seeded synthetic graph generators.
+# Each returns (vertex_count, edges) for an undirected weighted graph with about
+# `edge_count` edges and integer weights, connected by construction.
+
+def random_sparse_graph(edge_count: int, seed: int = 0, average_degree: int = 4):
+    """
+    Random sparse graph: a random spanning path plus uniformly random extra edges.
+    """
+    rng = random.Random(seed)
+    vertex_count = max(2, 2 * edge_count // average_degree)
+    order = list(range(vertex_count))
+    rng.shuffle(order)
+    seen = set()
+    edges = []
+
+    def add(v1, v2):
+        if v1 != v2 and (v1, v2) not in seen and (v2, v1) not in seen:
+            seen.add((v1, v2))
+            edges.append((v1, v2, rng.randint(1, 100)))
+
+    for v1, v2 in zip(order, order[1:]):
+        add(v1, v2)
+    attempts = 0
+    while len(edges) < edge_count and attempts < 4 * edge_count:
+        add(rng.randrange(vertex_count), rng.randrange(vertex_count))
+        attempts += 1
+    return vertex_count, edges
+
+
+def grid_graph(edge_count: int, seed: int = 0):
+    """
+    Square 4-neighbour grid with random weights.
+    """
+    rng = random.Random(seed)
+    side = max(2, int(math.sqrt(edge_count / 2)) + 1)
+    edges = []
+    for row in range(side):
+        for column in range(side):
+            vertex = row * side + column
+            if column + 1 < side:
+                edges.append((vertex, vertex + 1, rng.randint(1, 100)))
+            if row + 1 < side:
+                edges.append((vertex, vertex + side, rng.randint(1, 100)))
+    return side * side, edges
+
+
+def scale_free_graph(edge_count: int, seed: int = 0, attachments: int = 3):
+    """
+    Barabasi-Albert preferential attachment graph.
+    """
+    rng = random.Random(seed)
+    vertex_count = max(attachments + 1, edge_count // attachments)
+    edges = []
+    # every vertex appears once per incident edge, so a uniform pick is degree-proportional
+    endpoints = []
+    for v1 in range(attachments + 1):
+        for v2 in range(v1):
+            edges.append((v1, v2, rng.randint(1, 100)))
+            endpoints.extend((v1, v2))
+    for vertex in range(attachments + 1, vertex_count):
+        targets = set()
+        while len(targets) < attachments:
+            targets.add(rng.choice(endpoints))
+        for target in targets:
+            edges.append((vertex, target, rng.randint(1, 100)))
+            endpoints.extend((vertex, target))
+    return vertex_count, edges
+
+
+def road_like_graph(edge_count: int, seed: int = 0):
+    """
+    Road-like graph: a jittered planar grid with some diagonal shortcuts and
+    weights proportional to the Euclidean length of each edge.
+    """
+    rng = random.Random(seed)
+    side = max(2, int(math.sqrt(edge_count / 2.2)) + 1)
+    points = [(column + rng.uniform(-0.3, 0.3), row + rng.uniform(-0.3, 0.3))
+              for row in range(side) for column in range(side)]
+
+    def length(v1, v2):
+        (x1, y1), (x2, y2) = points[v1], points[v2]
+        return max(1, int(100 * math.hypot(x1 - x2, y1 - y2) * rng.uniform(1.0, 1.5)))
+
+    edges = []
+    for row in range(side):
+        for column in range(side):
+            vertex = row * side + column
+            if column + 1 < side:
+                edges.append((vertex, vertex + 1, length(vertex, vertex + 1)))
+            if row + 1 < side:
+                edges.append((vertex, vertex + side, length(vertex, vertex + side)))
+            if row + 1 < side and column + 1 < side and rng.random() < 0.2:
+                edges.append((vertex, vertex + side + 1, length(vertex, vertex + side + 1)))
+    return side * side, edges
+
+
+GENERATORS = {
+    "random_sparse": random_sparse_graph,
+    "grid": grid_graph,
+    "scale_free": scale_free_graph,
+    "road_like": road_like_graph,
+}
+
+
+def write_graph_file(file_path: str, vertex_count: int, edges) -> None:
+    """
+    Writes an undirected weighted graph in the `create_from_file` format.
+    :return: `None`
+    """
+    with open(file_path, "w") as file:
+        file.write("undirected weighted\n")
+        connected = set()
+        for v1, v2, weight in edges:
+            file.write(f"{v1} {v2} {weight}\n")
+            connected.add(v1)
+            connected.add(v2)
+        for vertex in range(vertex_count):
+            if vertex not in connected:
+                file.write(f"{vertex}\n")
+
+
+def eulerian_graph(vertex_count: int, edges) -> SimpleDirectedGraph:
+    """
+    Directed graph with both arcs of every generated edge. Every vertex then has equal
+    in- and out-degree, so a connected generator gives a graph with an Eulerian circuit.
+    :return: `SimpleDirectedGraph`
+    """
+    graph = SimpleDirectedGraph()
+    graph.change_if_directed()
+    for vertex in range(vertex_count):
+        graph.add_vertex(str(vertex))
+    for v1, v2, _ in edges:
+        graph.add_edge(str(v1), str(v2))
+        graph.add_edge(str(v2), str(v1))
+    return graph
+
+
+def _time(function, repeat: int):
+    """
+    Returns the best wall-clock time of `repeat` calls and the last result.
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_benchmarks(sizes, generators=None, repeat: int = 1, seed: int = 0, clique_limit: int = 18) -> dict:
+    """
+    Generates every graph, writes it to a temporary file, and times the project's algorithms on it.
+    The exhaustive backtracking clique search only runs on graphs with at most `clique_limit` vertices.
+    :return: `dict` with run metadata and one record per (generator, size, benchmark)
+    """
+    generators = generators or list(GENERATORS)
+    records = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in generators:
+            for size in sizes:
+                vertex_count, edges = GENERATORS[name](size, seed)
+                file_path = os.path.join(directory, f"{name}_{size}.txt")
+                write_graph_file(file_path, vertex_count, edges)
+
+                seconds, graph = _time(lambda: SimpleDirectedGraph.create_from_file(file_path), repeat)
+                benchmarks = [("create_from_file", seconds)]
+                start, goal = "0", str(vertex_count - 1)
+                # balanced variant of the graph, so get_eul_circuit times a full circuit, not the odd-degree early exit
+                eulerian = eulerian_graph(vertex_count, edges)
+                cases = [
+                    ("load_from_file", lambda: SimpleDirectedGraph.load_from_file(file_path)),
+                    ("bfs_iter", lambda: sum(1 for _ in graph.bfs_iter(start))),
+                    ("dijkstra", lambda: dijkstra(graph, start)),
+                    ("delta_stepping", lambda: delta_stepping(graph, start)),
+                    ("ucs", lambda: UCS.uniform_cost_search(graph, start)),
+                    ("ucs2", lambda: UCS2.uniform_cost_search(graph, start, goal)),
+                    ("min_spanning_tree", lambda: min_spanning_tree(graph)),
+                    ("get_eul_circuit", lambda: get_eul_circuit(eulerian)),
+                    ("clique_search", lambda: find_maximum_cliques(graph)),
+                    ("count_triangles", lambda: count_triangles(graph)),
+                ]
+                if vertex_count <= clique_limit:
+                    cases.append(("clique_backtracking", lambda: find_maximum_cliques_backtracking(graph)))
+                for benchmark, function in cases:
+                    benchmarks.append((benchmark, _time(function, repeat)[0]))
+
+                for benchmark, seconds in benchmarks:
+                    records.append({
+                        "generator": name,
+                        "edges": len(edges),
+                        "vertices": vertex_count,
+                        "size": size,
+                        "benchmark": benchmark,
+                        "seconds": seconds,
+                    })
+                    print(f"{name:>14} {size:>9} {benchmark:>18}: {seconds * 1000:10.2f}ms", flush=True)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": records,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.2) -> list:
+    """
+    Flags benchmarks that got slower than the baseline by more than `threshold` (0.2 = 20%).
+    :return: `list` of `(generator, size, benchmark, baseline_seconds, current_seconds)`
+    """
+    previous = {(record["generator"], record["size"], record["benchmark"]): record["seconds"]
+                for record in baseline["results"]}
+    regressions = []
+    for record in current["results"]:
+        key = (record["generator"], record["size"], record["benchmark"])
+        if key in previous and record["seconds"] > previous[key] * (1 + threshold):
+            regressions.append(key + (previous[key], record["seconds"]))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the graph algorithms on synthetic graphs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000],
+                        help="approximate edge counts, from 10^3 up to 10^7")
+    parser.add_argument("--generators", nargs="+", choices=list(GENERATORS), default=None)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.generators, args.repeat, args.seed)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            baseline = json.load(file)
+        regressions = compare_results(baseline, results, args.threshold)
+        for generator, size, benchmark, before, after in regressions:
+            print(f"REGRESSION {generator} {size} {benchmark}: {before * 1000:.2f}ms -> {after * 1000:.2f}ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
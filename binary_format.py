@@ -0,0 +1,153 @@
+import mmap
+import struct
+import sys
+
+from csr import CSRGraph
+
+# Layout, every section aligned to 8 bytes:
+#   header | name offsets (V + 1 int64) | names (utf-8) | offsets (V + 1 int64) | targets (E int64) | weights (E)
+MAGIC = b"SDGB"
+VERSION = 1
+HEADER = struct.Struct("<4sIIQQQ")
+
+FLAG_DIRECTED = 1
+FLAG_WEIGHTED = 2
+FLAG_FLOAT_WEIGHTS = 4
+FLAG_BIG_ENDIAN = 8
+
+
+class MappedLabels:
+    """
+    Read-only sequence of vertex labels decoded lazily from the vertex-name table of a mapped file.
+    """
+
+    def __init__(self, name_offsets, names) -> None:
+        self.name_offsets = name_offsets
+        self.names = names
+
+    def __len__(self) -> int:
+        return len(self.name_offsets) - 1
+
+    def __getitem__(self, vertex_id: int) -> str:
+        if not 0 <= vertex_id < len(self):
+            raise IndexError(f"Vertex ID {vertex_id} is out of range.")
+        return bytes(self.names[self.name_offsets[vertex_id]:self.name_offsets[vertex_id + 1]]).decode()
+
+    def __iter__(self):
+        for vertex_id in range(len(self)):
+            yield self[vertex_id]
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % 8)
+
+
+def save_binary(csr: CSRGraph, file_path: str) -> None:
+    """
+    Writes a CSR snapshot to a binary file that `load_binary` can memory-map.
+    Vertex labels must be strings.
+    Time Complexity: O(V + E)
+    :param csr: `CSRGraph`
+    :param file_path: Path to the output file.
+    :return: `None`
+    """
+    encoded = []
+    name_offsets = [0]
+    for label in csr.labels:
+        if not isinstance(label, str):
+            raise ValueError(f"Vertex '{label}' is not a string, only string labels can be saved.")
+        encoded.append(label.encode())
+        name_offsets.append(name_offsets[-1] + len(encoded[-1]))
+    names = b"".join(encoded)
+
+    flags = 0
+    if csr.is_directed:
+        flags |= FLAG_DIRECTED
+    if csr.is_weighted:
+        flags |= FLAG_WEIGHTED
+        if csr.weights.format == "d":
+            flags |= FLAG_FLOAT_WEIGHTS
+    if sys.byteorder == "big":
+        flags |= FLAG_BIG_ENDIAN
+
+    with open(file_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, flags, csr.get_v(), len(csr.targets), len(names)))
+        file.write(_padding(HEADER.size))
+        file.write(struct.pack(f"={len(name_offsets)}q", *name_offsets))
+        file.write(names)
+        file.write(_padding(len(names)))
+        file.write(csr.offsets.tobytes())
+        file.write(csr.targets.tobytes())
+        if csr.is_weighted:
+            file.write(csr.weights.tobytes())
+
+
+def load_binary(file_path: str) -> CSRGraph:
+    """
+    Memory-maps a file written by `save_binary` and returns a CSR snapshot backed by it.
+    Nothing is parsed up front, so opening is near-instant and several processes
+    mapping the same file share its pages.
+    Time Complexity: O(1)
+    :param file_path: Path to the binary file.
+    :return: `CSRGraph`
+    """
+    with open(file_path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapping) < HEADER.size:
+        raise ValueError(f"File '{file_path}' is not a binary graph file.")
+    magic, version, flags, vertex_count, edge_slots, names_size = HEADER.unpack_from(mapping)
+    if magic != MAGIC:
+        raise ValueError(f"File '{file_path}' is not a binary graph file.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary graph version {version}.")
+    if bool(flags & FLAG_BIG_ENDIAN) != (sys.byteorder == "big"):
+        raise ValueError("Binary graph file was written on a machine with a different byte order.")
+
+    view = memoryview(mapping)
+    position = HEADER.size + len(_padding(HEADER.size))
+
+    def section(size: int, typecode: str):
+        nonlocal position
+        start = position
+        position += size + len(_padding(size))
+        part = view[start:start + size]
+        return part if typecode == "B" else part.cast(typecode)
+
+    name_offsets = section(8 * (vertex_count + 1), "q")
+    names = section(names_size, "B")
+    offsets = section(8 * (vertex_count + 1), "q")
+    targets = section(8 * edge_slots, "q")
+    weights = None
+    if flags & FLAG_WEIGHTED:
+        weights = section(8 * edge_slots, "d" if flags & FLAG_FLOAT_WEIGHTS else "q")
+    if position > len(mapping):
+        raise ValueError(f"File '{file_path}' is truncated.")
+
+    csr = CSRGraph(MappedLabels(name_offsets, names), offsets, targets, weights,
+                   bool(flags & FLAG_DIRECTED), bool(flags & FLAG_WEIGHTED))
+    csr._mapping = mapping
+    return csr
+
+
+def convert_text_to_binary(text_path: str, binary_path: str, **options) -> CSRGraph:
+    """
+    Converts a text graph file (the `create_from_file` format) into the binary format.
+    :param text_path: Path to the text input file.
+    :param binary_path: Path to the binary output file.
+    :param options: Options for `SimpleDirectedGraph.load_from_file`
+    :return: the written `CSRGraph`
+    """
+    from domain import SimpleDirectedGraph
+
+    csr = SimpleDirectedGraph.load_from_file(text_path, **options).to_csr()
+    save_binary(csr, binary_path)
+    return csr
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python binary_format.py <input.txt> <output.bin>")
+        sys.exit(1)
+    converted = convert_text_to_binary(sys.argv[1], sys.argv[2])
+    print(f"Wrote {converted.get_v()} vertices and {converted.get_e()} edges to {sys.argv[2]}")
@@ -0,0 +1,128 @@
+class BitsetAdjacency:
+    """
+    Read-only bitset adjacency of a SimpleDirectedGraph for dense-graph kernels.
+    Row `v` is a Python int whose bit `u` is set when there is an edge v -> u, over
+    the graph's interned vertex IDs (freed IDs have an empty row). Intersections,
+    subset tests and degrees then run as word-parallel big-int operations.
+    Later changes to the graph are not reflected; use `SimpleDirectedGraph.to_bitset`,
+    which rebuilds the bitsets only when the graph has changed.
+    """
+
+    def __init__(self, labels, rows, is_directed: bool) -> None:
+        """
+        Time Complexity: O(1)
+        :param labels: sequence mapping vertex ID -> vertex label (None for a freed ID)
+        :param rows: sequence of int neighbour bitsets indexed by vertex ID
+        """
+        self.labels = labels
+        self.rows = rows
+        self.is_directed = is_directed
+        self.vertex_mask = sum(1 << vertex_id for vertex_id, label in enumerate(labels) if label is not None)
+
+    @classmethod
+    def from_graph(cls, graph) -> "BitsetAdjacency":
+        """
+        Builds the bitsets of the given graph. Self-loops are left out, so a row never
+        contains its own vertex.
+        Time Complexity: O(V + E) big-int operations
+        :param graph: `SimpleDirectedGraph`
+        :return: `BitsetAdjacency`
+        """
+        ids = graph.vertex_ids
+        rows = [0] * graph.id_bound()
+        for vertex, neighbors in graph.graph_repo.items():
+            vertex_id = ids[vertex]
+            row = 0
+            for neighbor in neighbors:
+                row |= 1 << ids[neighbor]
+            rows[vertex_id] = row & ~(1 << vertex_id)
+        return cls(list(graph.vertex_labels), rows, graph.is_directed)
+
+    def neighbours(self, vertex_id: int) -> int:
+        """
+        Returns the neighbour bitset of a vertex ID.
+        :return: `int`
+        """
+        return self.rows[vertex_id]
+
+    def has_edge(self, vertex_id1: int, vertex_id2: int) -> bool:
+        """
+        Checks for an edge vertex_id1 -> vertex_id2.
+        Time Complexity: O(1)
+        :return: `bool`
+        """
+        return bool(self.rows[vertex_id1] >> vertex_id2 & 1)
+
+    def degree(self, vertex_id: int) -> int:
+        """
+        Out-degree of a vertex ID by popcount, self-loops excluded.
+        Time Complexity: O(V / 64)
+        :return: `int`
+        """
+        return self.rows[vertex_id].bit_count()
+
+    def common_neighbours(self, vertex_id1: int, vertex_id2: int) -> int:
+        """
+        Returns the bitset of vertices adjacent to both vertex IDs.
+        Time Complexity: O(V / 64)
+        :return: `int`
+        """
+        return self.rows[vertex_id1] & self.rows[vertex_id2]
+
+    def is_subset(self, mask: int, vertex_id: int) -> bool:
+        """
+        Checks whether every vertex of the bitset is a neighbour of vertex_id.
+        Time Complexity: O(V / 64)
+        :return: `bool`
+        """
+        return mask & ~self.rows[vertex_id] == 0
+
+    def is_clique(self, vertex_ids) -> bool:
+        """
+        Checks whether the given vertex IDs are pairwise adjacent.
+        Time Complexity: O(k * V / 64) for k vertices
+        :return: `bool`
+        """
+        mask = to_mask(vertex_ids)
+        return all(self.is_subset(mask & ~(1 << vertex_id), vertex_id) for vertex_id in vertex_ids)
+
+    def to_labels(self, mask: int) -> list:
+        """
+        Converts a bitset to the list of vertex labels, in ID order.
+        :return: `list`
+        """
+        return [self.labels[vertex_id] for vertex_id in iter_bits(mask)]
+
+
+def to_mask(vertex_ids) -> int:
+    """
+    Converts vertex IDs to a bitset.
+    :return: `int`
+    """
+    mask = 0
+    for vertex_id in vertex_ids:
+        mask |= 1 << vertex_id
+    return mask
+
+
+def iter_bits(mask: int):
+    """
+    Yields the positions of the set bits of a bitset in increasing order.
+    Time Complexity: O(k * V / 64) for k set bits
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def edge_density(graph) -> float:
+    """
+    Edge density of a graph: the number of edges over the maximum possible number.
+    :return: `float`
+    """
+    vertex_count = graph.get_v()
+    max_edges = vertex_count * (vertex_count - 1)
+    if not graph.is_directed:
+        max_edges //= 2
+    return graph.get_e() / max_edges if max_edges else 0.0
@@ -0,0 +1,313 @@
+import multiprocessing
+import os
+import tempfile
+from array import array
+
+from iterator import CSRBFSIterator, CSRDFSIterator, CSRLevelBFSIterator
+
+
+class CSRGraph:
+    """
+    Immutable compressed sparse row (CSR) snapshot of a SimpleDirectedGraph.
+    Vertices are dense integer IDs in [0, V). The outbound edges of vertex `v`
+    are targets[offsets[v]:offsets[v + 1]] with the matching weights.
+    Undirected graphs store every edge in both directions, like `graph_repo`.
+    """
+
+    def __init__(self, labels, offsets, targets, weights, is_directed: bool, is_weighted: bool) -> None:
+        """
+        Time Complexity: O(1)
+        :param labels: sequence mapping vertex ID -> vertex label
+        :param offsets: V + 1 edge offsets
+        :param targets: E target vertex IDs
+        :param weights: E edge weights, or `None` for an unweighted graph
+        """
+        self.labels = labels
+        self.offsets = _read_only(offsets)
+        self.targets = _read_only(targets)
+        self.weights = _read_only(weights) if weights is not None else None
+        self.is_directed = is_directed
+        self.is_weighted = is_weighted
+        self._index = None
+        # keeps a memory-mapped file open while the views above point into it
+        self._mapping = None
+
+    @classmethod
+    def from_graph(cls, graph) -> "CSRGraph":
+        """
+        Builds a snapshot of the given graph. Vertex IDs follow the graph's interned
+        vertex IDs, compacted when vertices have been removed, so they are equal to
+        `graph.vertex_id` whenever the graph has no freed IDs. An undirected self-loop
+        is stored as two arcs in both adjacency modes.
+        Time Complexity: O(V + E)
+        :param graph: `SimpleDirectedGraph`
+        :return: `CSRGraph`
+        """
+        labels = [label for label in graph.vertex_labels if label is not None]
+        index = {label: vertex_id for vertex_id, label in enumerate(labels)}
+
+        offsets = array("q", [0])
+        targets = array("q")
+        raw_weights = []
+
+        # set mode stores an undirected self-loop once, list mode twice
+        double_loops = graph.adjacency == "set" and not graph.is_directed
+        for vertex in labels:
+            weight_row = graph.graph_weight_repo.get(vertex, {}) if graph.is_weighted else None
+            neighbors = graph.graph_repo[vertex]
+            if double_loops and vertex in neighbors:
+                neighbors = [neighbor for neighbor in neighbors for _ in range(2 if neighbor == vertex else 1)]
+            for neighbor in neighbors:
+                targets.append(index[neighbor])
+                if weight_row is not None:
+                    raw_weights.append(weight_row.get(neighbor, 0))
+            offsets.append(len(targets))
+
+        weights = None
+        if graph.is_weighted:
+            typecode = "q" if all(isinstance(weight, int) for weight in raw_weights) else "d"
+            weights = array(typecode, raw_weights)
+
+        csr = cls(labels, offsets, targets, weights, graph.is_directed, graph.is_weighted)
+        csr._index = index
+        return csr
+
+    def vertex_id(self, vertex_name) -> int:
+        """
+        Returns the integer ID of a vertex label.
+        :return: `int`
+        """
+        if self._index is None:
+            self._index = {label: vertex_id for vertex_id, label in enumerate(self.labels)}
+        if vertex_name not in self._index:
+            raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
+        return self._index[vertex_name]
+
+    def vertex_label(self, vertex_id: int):
+        """
+        Returns the label of a vertex ID.
+        """
+        if not 0 <= vertex_id < self.get_v():
+            raise ValueError(f"Vertex ID {vertex_id} is out of range.")
+        return self.labels[vertex_id]
+
+    def get_v(self) -> int:
+        """
+        Returns the number of vertices in the snapshot.
+        :return: `int`
+        """
+        return len(self.offsets) - 1
+
+    def get_e(self) -> int:
+        """
+        Returns the number of edges, counting undirected edges once.
+        :return: `int`
+        """
+        if self.is_directed:
+            return len(self.targets)
+        return len(self.targets) // 2
+
+    def out_degree(self, vertex_id: int) -> int:
+        """
+        Returns the number of outbound edges of a vertex ID.
+        :return: `int`
+        """
+        return self.offsets[vertex_id + 1] - self.offsets[vertex_id]
+
+    def neighbour_ids(self, vertex_id: int):
+        """
+        Returns a read-only view of the neighbour IDs of a vertex ID.
+        Time Complexity: O(1)
+        """
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def iter_edges(self, vertex_id: int):
+        """
+        Yields `(neighbour_id, weight)` pairs for a vertex ID.
+        The weight is `None` when the snapshot is unweighted.
+        """
+        targets = self.targets
+        weights = self.weights
+        for position in range(self.offsets[vertex_id], self.offsets[vertex_id + 1]):
+            yield targets[position], (weights[position] if weights is not None else None)
+
+    def thaw(self, **options):
+        """
+        Builds a mutable SimpleDirectedGraph with the same vertices and edges.
+        Time Complexity: O(V + E)
+        :param options: Constructor options for SimpleDirectedGraph
+        :return: `SimpleDirectedGraph`
+        """
+        from domain import SimpleDirectedGraph
+
+        graph = SimpleDirectedGraph(**options)
+        graph.is_directed = self.is_directed
+        graph.is_weighted = self.is_weighted
+        labels = list(self.labels)
+        for label in labels:
+            graph.add_vertex(label)
+        for vertex_id, label in enumerate(labels):
+            for position in range(self.offsets[vertex_id], self.offsets[vertex_id + 1]):
+                neighbor = labels[self.targets[position]]
+                graph._link(label, neighbor)
+                if self.is_weighted:
+                    graph.graph_weight_repo[label][neighbor] = self.weights[position]
+        graph._components_stale = True
+        return graph
+
+    def save_binary(self, file_path: str) -> None:
+        """
+        Writes the snapshot to a binary file, see `binary_format.save_binary`.
+        :return: `None`
+        """
+        from binary_format import save_binary
+
+        save_binary(self, file_path)
+
+    @staticmethod
+    def load_binary(file_path: str) -> "CSRGraph":
+        """
+        Memory-maps a binary graph file, see `binary_format.load_binary`.
+        :return: `CSRGraph`
+        """
+        from binary_format import load_binary
+
+        return load_binary(file_path)
+
+    def bfs_iter(self, start_vertex):
+        """
+        Returns a Breadth-First Search iterator over vertex IDs, starting from the given vertex label.
+        """
+        return CSRBFSIterator(self, self.vertex_id(start_vertex))
+
+    def bfs_levels(self, start_vertices, max_depth: int = None, stop=None):
+        """
+        Returns a level-synchronous, multi-source BFS iterator over vertex IDs, starting
+        from the given vertex labels, yielding `(depth, frontier)` batches.
+        `stop` receives vertex IDs.
+        """
+        return CSRLevelBFSIterator(self, [self.vertex_id(vertex) for vertex in start_vertices], max_depth, stop)
+
+    def dfs_iter(self, start_vertex):
+        """
+        Returns a Depth-First Search iterator over vertex IDs, starting from the given vertex label.
+        """
+        return CSRDFSIterator(self, self.vertex_id(start_vertex))
+
+
+def label_results(csr: CSRGraph, distances, previous_vertices) -> tuple:
+    """
+    Converts distance and predecessor lists indexed by snapshot vertex ID
+    into dicts keyed by vertex label.
+    Time Complexity: O(V)
+    :param distances: sequence of distances indexed by vertex ID
+    :param previous_vertices: sequence of predecessor IDs indexed by vertex ID, None for no predecessor
+    :return: `tuple` (distances, previous_vertices) label-keyed dicts
+    """
+    labels = csr.labels
+    distance_map = dict(zip(labels, distances))
+    previous_map = {label: labels[previous] if previous is not None else None
+                    for label, previous in zip(labels, previous_vertices)}
+    return distance_map, previous_map
+
+
+# Snapshot and engine state of a SnapshotPool worker process, set by its initializer
+_pool_csr = None
+_pool_state = None
+
+
+def _init_pool_worker(csr, binary_path, state) -> None:
+    """
+    Process pool initializer: keeps the inherited snapshot (fork) or memory-maps the shared binary file (spawn).
+    """
+    global _pool_csr, _pool_state
+    _pool_csr = CSRGraph.load_binary(binary_path) if binary_path is not None else csr
+    _pool_state = state
+
+
+def _run_pool_task(task):
+    """
+    Runs one `(function, argument)` task on the snapshot of a pool worker.
+    """
+    function, argument = task
+    return function(_pool_csr, _pool_state, argument)
+
+
+class SnapshotPool:
+    """
+    Process pool whose workers share one read-only CSR snapshot, through fork where
+    available (children inherit the snapshot pages copy-on-write) and otherwise through
+    a memory-mapped binary file, so the graph is never pickled per task.
+    Engines pass module-level worker functions called as `function(csr, state, task)`.
+    With one worker, or a single task, they run in-process on the caller's snapshot; the
+    workers are only started by the first `map` call with more than one task.
+    Use as a context manager: leaving it stops the workers and removes the binary file.
+    """
+
+    def __init__(self, csr: CSRGraph, workers: int = None, state=None) -> None:
+        """
+        Time Complexity: O(1)
+        :param csr: snapshot shared by the workers
+        :param workers: number of processes, defaults to the number of CPUs
+        :param state: picklable engine state handed to every worker function
+        """
+        self.csr = csr
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.state = state
+        self.pool = None
+        self._binary_path = None
+
+    def __enter__(self) -> "SnapshotPool":
+        return self
+
+    def _start(self) -> None:
+        """
+        Starts the worker processes, on the first `map` call that has tasks to spread.
+        """
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            initargs = (self.csr, None, self.state)
+        else:
+            context = multiprocessing.get_context()
+            handle, self._binary_path = tempfile.mkstemp(suffix=".bin")
+            os.close(handle)
+            self.csr.save_binary(self._binary_path)
+            initargs = (None, self._binary_path, self.state)
+        self.pool = context.Pool(self.workers, initializer=_init_pool_worker, initargs=initargs)
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if self.pool is not None:
+            # an error, or a consumer that stopped early, abandons the remaining tasks
+            if exc_type is None:
+                self.pool.close()
+            else:
+                self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        if self._binary_path is not None:
+            os.remove(self._binary_path)
+            self._binary_path = None
+
+    def map(self, function, tasks, chunksize: int = 1):
+        """
+        Calls `function(csr, state, task)` for every task and returns an iterator of the
+        results, in no particular order when the tasks run across the pool.
+        :param function: module-level worker function
+        :param tasks: iterable of picklable task arguments
+        :param chunksize: number of tasks handed to a worker at a time
+        :return: iterator
+        """
+        tasks = list(tasks)
+        if self.workers <= 1 or len(tasks) <= 1:
+            return (function(self.csr, self.state, task) for task in tasks)
+        if self.pool is None:
+            self._start()
+        return self.pool.imap_unordered(_run_pool_task, [(function, task) for task in tasks], chunksize)
+
+
+def _read_only(buffer):
+    """
+    Wraps an array-like buffer into a read-only memoryview, so the snapshot cannot be mutated.
+    """
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    return view if view.readonly else view.toreadonly()
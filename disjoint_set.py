@@ -0,0 +1,71 @@
+class DisjointSet:
+    """
+    Disjoint-set (union-find) forest with path compression and union by rank.
+    Time Complexity: O(α(n)) amortised per find/union
+    """
+
+    def __init__(self, items=()) -> None:
+        """
+        :param items: initial singleton sets
+        """
+        self.parent = {}
+        self.rank = {}
+        self.set_count = 0
+        for item in items:
+            self.make_set(item)
+
+    def __contains__(self, item) -> bool:
+        return item in self.parent
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def make_set(self, item) -> None:
+        """
+        Adds item as a new singleton set.
+        :return: `None`
+        """
+        if item in self.parent:
+            raise ValueError(f"Item '{item}' already exists in the disjoint set.")
+        self.parent[item] = item
+        self.rank[item] = 0
+        self.set_count += 1
+
+    def find(self, item):
+        """
+        Returns the representative of the set containing item.
+        """
+        parent = self.parent
+        if item not in parent:
+            raise ValueError(f"Item '{item}' not found in the disjoint set.")
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        # path compression
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, item1, item2) -> bool:
+        """
+        Merges the sets containing item1 and item2.
+        :return: `True` if two different sets were merged, `False` if they were already one set
+        """
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 == root2:
+            return False
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+        self.set_count -= 1
+        return True
+
+    def connected(self, item1, item2) -> bool:
+        """
+        Checks if item1 and item2 are in the same set.
+        :return: `bool`
+        """
+        return self.find(item1) == self.find(item2)
@@ -1,16 +1,141 @@
 import copy
-from iterator import DFSIterator,BFSIterator
+import heapq
+import os
+from collections.abc import Sequence
+from iterator import DFSIterator,BFSIterator,LevelBFSIterator
+from csr import CSRGraph
+from bitset import BitsetAdjacency
+from disjoint_set import DisjointSet
+
+
+class NeighbourView(Sequence):
+    """
+    Read-only, zero-copy view over the neighbour list of a vertex.
+    It reflects later changes to the graph; indexing and iteration cost O(1) per item,
+    membership tests O(deg) like the underlying list.
+    """
+    __slots__ = ("_neighbors",)
+
+    def __init__(self, neighbors: list) -> None:
+        self._neighbors = neighbors
+
+    def __getitem__(self, index):
+        return self._neighbors[index]
+
+    def __len__(self) -> int:
+        return len(self._neighbors)
+
+    def __iter__(self):
+        return iter(self._neighbors)
+
+    def __contains__(self, vertex) -> bool:
+        return vertex in self._neighbors
+
+    def __repr__(self) -> str:
+        return f"NeighbourView({self._neighbors!r})"
 
 
 class SimpleDirectedGraph:
-    def __init__(self) -> None:
+    def __init__(self, track_inbound: bool = False, adjacency: str = "list",
+                 track_components: bool = False) -> None:
         """
         Time Complexity: O(1)
-        """
+        :param track_inbound: maintain an incoming-edge index, so `inbound_neighbours`
+        and `remove_vertex` cost time proportional to the vertex degree
+        :param adjacency: "list" stores neighbours in lists, "set" stores them in
+        insertion-ordered dicts for O(1) edge checks, insertions and deletions
+        :param track_components: maintain a union-find connectivity index, updated
+        incrementally by `add_vertex`/`add_edge` and rebuilt lazily after deletions
+        """
+        if adjacency not in {"list", "set"}:
+            raise ValueError(f"Unknown adjacency mode '{adjacency}', expected 'list' or 'set'.")
+        self.adjacency = adjacency
         self.graph_repo = {}
         self.graph_weight_repo = {}
         self.is_directed = False
         self.is_weighted = False
+        # bumped by every mutation, so caches can detect stale results
+        self.version = 0
+        # vertex -> {source: None} for every edge source -> vertex, or None when not tracked
+        self.inbound_repo = {} if track_inbound else None
+        # Interning layer: label -> dense integer ID and ID -> label (None for a freed ID)
+        self.vertex_ids = {}
+        self.vertex_labels = []
+        self._free_ids = []
+        # Connectivity index over the (weakly) connected components, None when not tracked
+        self.components = DisjointSet() if track_components else None
+        self._components_stale = False
+        # (version, BitsetAdjacency) of the last `to_bitset` call
+        self._bitset_cache = None
+        # (version, CSRGraph) of the last `to_csr` call
+        self._csr_cache = None
+
+    def _new_adjacency(self):
+        """
+        Returns an empty neighbour container for the current adjacency mode.
+        """
+        return {} if self.adjacency == "set" else []
+
+    def _link(self, vertex1, vertex2) -> None:
+        """
+        Appends vertex2 to the adjacency of vertex1 and keeps the incoming-edge index up to date.
+        """
+        if self.adjacency == "set":
+            self.graph_repo[vertex1][vertex2] = None
+        else:
+            self.graph_repo[vertex1].append(vertex2)
+        if self.inbound_repo is not None:
+            self.inbound_repo[vertex2][vertex1] = None
+
+    def _unlink(self, vertex1, vertex2) -> None:
+        """
+        Removes vertex2 from the adjacency of vertex1 and keeps the incoming-edge index up to date.
+        """
+        self._discard(vertex1, vertex2)
+        if self.inbound_repo is not None:
+            self.inbound_repo[vertex2].pop(vertex1, None)
+
+    def _discard(self, vertex1, vertex2) -> None:
+        """
+        Removes vertex2 from the adjacency of vertex1 without touching the incoming-edge index.
+        """
+        if self.adjacency == "set":
+            del self.graph_repo[vertex1][vertex2]
+        else:
+            self.graph_repo[vertex1].remove(vertex2)
+
+    def _intern(self, vertex_name) -> int:
+        """
+        Assigns a dense integer ID to a new vertex label, reusing the smallest freed ID first.
+        """
+        if self._free_ids:
+            vertex_id = heapq.heappop(self._free_ids)
+            self.vertex_labels[vertex_id] = vertex_name
+        else:
+            vertex_id = len(self.vertex_labels)
+            self.vertex_labels.append(vertex_name)
+        self.vertex_ids[vertex_name] = vertex_id
+        return vertex_id
+
+    def _release(self, vertex_name) -> None:
+        """
+        Frees the integer ID of a removed vertex label.
+        """
+        vertex_id = self.vertex_ids.pop(vertex_name)
+        self.vertex_labels[vertex_id] = None
+        heapq.heappush(self._free_ids, vertex_id)
+
+    def _rebuild_inbound(self) -> None:
+        """
+        Recomputes the incoming-edge index from the adjacency lists.
+        Time Complexity: O(V + E)
+        """
+        if self.inbound_repo is None:
+            return
+        self.inbound_repo = {vertex: {} for vertex in self.graph_repo}
+        for vertex, neighbors in self.graph_repo.items():
+            for neighbor in neighbors:
+                self.inbound_repo[neighbor][vertex] = None
 
     def change_if_directed(self) -> None:
         """
@@ -27,7 +152,7 @@ class SimpleDirectedGraph:
             for vertex in list(self.graph_repo.keys()):
                 for neighbor in list(self.graph_repo[vertex]):
                     if vertex not in self.graph_repo[neighbor]:
-                        self.graph_repo[neighbor].append(vertex)
+                        self._link(neighbor, vertex)
                         if self.is_weighted:
                             if neighbor not in self.graph_weight_repo:
                                 self.graph_weight_repo[neighbor] = {}
@@ -38,7 +163,7 @@ class SimpleDirectedGraph:
             for vertex in list(self.graph_repo.keys()):
                 for neighbor in list(self.graph_repo[vertex]):
                     if vertex not in self.graph_repo[neighbor]:
-                        self.graph_repo[neighbor].append(vertex)
+                        self._link(neighbor, vertex)
                         if self.is_weighted:
                             if neighbor not in self.graph_weight_repo:
                                 self.graph_weight_repo[neighbor] = {}
@@ -46,7 +171,11 @@ class SimpleDirectedGraph:
                             weight = self.graph_weight_repo.get(vertex, {}).get(neighbor, 0)
                             self.graph_weight_repo[neighbor][vertex] = weight
                 # Remove any duplicates from the neighbor list.
-                self.graph_repo[vertex] = list(set(self.graph_repo[vertex]))
+                if self.adjacency == "list":
+                    self.graph_repo[vertex] = list(set(self.graph_repo[vertex]))
+
+        self._rebuild_inbound()
+        self.version += 1
 
     def change_if_weighted(self) -> None:
         """
@@ -62,6 +191,7 @@ class SimpleDirectedGraph:
                     self.graph_weight_repo[vertex][edge] = 0
         else:
             self.graph_weight_repo.clear()
+        self.version += 1
 
     def set_weight(self, vertex1, vertex2, weight: int) -> None:
         """
@@ -91,6 +221,7 @@ class SimpleDirectedGraph:
                 self.graph_weight_repo[vertex2] = {}
             self.graph_weight_repo[vertex1][vertex2] = weight
             self.graph_weight_repo[vertex2][vertex1] = weight
+        self.version += 1
 
     def add_vertex(self, vertex_name) -> None:
         """
@@ -98,11 +229,17 @@ class SimpleDirectedGraph:
         :return:`None`
         """
         if vertex_name not in self.graph_repo:
-            self.graph_repo[vertex_name] = []
+            self.graph_repo[vertex_name] = self._new_adjacency()
+            self._intern(vertex_name)
+            if self.components is not None and not self._components_stale:
+                self.components.make_set(vertex_name)
+            if self.inbound_repo is not None:
+                self.inbound_repo[vertex_name] = {}
             if self.is_weighted :
                 self.graph_weight_repo[vertex_name] = {}
         else:
             raise ValueError(f"Vertex '{vertex_name}' already exists in the graph.")
+        self.version += 1
 
     def add_edge(self, vertex1, vertex2, weight: int = 0) -> None:
         """
@@ -124,15 +261,15 @@ class SimpleDirectedGraph:
             raise ValueError(f"Edge from '{vertex1}' to '{vertex2}' already exists.")
 
         if self.is_directed:
-            self.graph_repo[vertex1].append(vertex2)
+            self._link(vertex1, vertex2)
             if self.is_weighted:
                 if vertex1 not in self.graph_weight_repo:
                     self.graph_weight_repo[vertex1] = {}
                 self.graph_weight_repo[vertex1][vertex2] = weight
         else:
 
-            self.graph_repo[vertex1].append(vertex2)
-            self.graph_repo[vertex2].append(vertex1)
+            self._link(vertex1, vertex2)
+            self._link(vertex2, vertex1)
             if self.is_weighted:
                 if vertex1 not in self.graph_weight_repo:
                     self.graph_weight_repo[vertex1] = {}
@@ -140,6 +277,9 @@ class SimpleDirectedGraph:
                     self.graph_weight_repo[vertex2] = {}
                 self.graph_weight_repo[vertex1][vertex2] = weight
                 self.graph_weight_repo[vertex2][vertex1] = weight
+        if self.components is not None and not self._components_stale:
+            self.components.union(vertex1, vertex2)
+        self.version += 1
 
     def get_weight(self, vertex1, vertex2) -> int:
         """
@@ -162,20 +302,24 @@ class SimpleDirectedGraph:
         if self.is_directed:
             if vertex2 not in self.graph_repo[vertex1]:
                 raise ValueError(f"No edge exists from '{vertex1}' to '{vertex2}'.")
-            self.graph_repo[vertex1].remove(vertex2)
+            self._unlink(vertex1, vertex2)
 
             if self.is_weighted and vertex1 in self.graph_weight_repo:
                 self.graph_weight_repo[vertex1].pop(vertex2, None)
         else:
             if vertex2 not in self.graph_repo[vertex1] and vertex1 not in self.graph_repo[vertex2]:
                 raise ValueError(f"No edge exists between '{vertex1}' and '{vertex2}'.")
-            self.graph_repo[vertex1].remove(vertex2)
-            self.graph_repo[vertex2].remove(vertex1)
+            self._unlink(vertex1, vertex2)
+            # set mode stores an undirected self-loop once, list mode twice
+            if vertex1 != vertex2 or self.adjacency == "list":
+                self._unlink(vertex2, vertex1)
             if self.is_weighted:
                 if vertex1 in self.graph_weight_repo:
                     self.graph_weight_repo[vertex1].pop(vertex2, None)
                 if vertex2 in self.graph_weight_repo:
                     self.graph_weight_repo[vertex2].pop(vertex1, None)
+        self._components_stale = True
+        self.version += 1
 
     def remove_vertex(self, vertex_name) -> None:
         """
@@ -185,16 +329,114 @@ class SimpleDirectedGraph:
         if vertex_name not in self.graph_repo:
             raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
 
-        for key in list(self.graph_repo.keys()):
-            if vertex_name in self.graph_repo[key]:
-                self.graph_repo[key].remove(vertex_name)
-                if self.is_weighted and key in self.graph_weight_repo:
-                    self.graph_weight_repo[key].pop(vertex_name, None)
+        if self.inbound_repo is not None:
+            # Only the sources of incoming edges need to be visited
+            for key in list(self.inbound_repo[vertex_name]):
+                if key != vertex_name:
+                    self._discard(key, vertex_name)
+                    if self.is_weighted and key in self.graph_weight_repo:
+                        self.graph_weight_repo[key].pop(vertex_name, None)
+            for neighbor in self.graph_repo[vertex_name]:
+                self.inbound_repo[neighbor].pop(vertex_name, None)
+            del self.inbound_repo[vertex_name]
+        else:
+            for key in list(self.graph_repo.keys()):
+                if vertex_name in self.graph_repo[key]:
+                    self._discard(key, vertex_name)
+                    if self.is_weighted and key in self.graph_weight_repo:
+                        self.graph_weight_repo[key].pop(vertex_name, None)
 
         del self.graph_repo[vertex_name]
+        self._release(vertex_name)
+        self._components_stale = True
 
         if self.is_weighted and vertex_name in self.graph_weight_repo:
             del self.graph_weight_repo[vertex_name]
+        self.version += 1
+
+    def vertex_id(self, vertex_name) -> int:
+        """
+        Returns the dense integer ID of a vertex label.
+        IDs stay stable while the vertex exists; the ID of a removed vertex is reused.
+        :return:`int`
+        """
+        if vertex_name not in self.vertex_ids:
+            raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
+        return self.vertex_ids[vertex_name]
+
+    def vertex_label(self, vertex_id: int):
+        """
+        Returns the vertex label of an integer ID.
+        """
+        if not 0 <= vertex_id < len(self.vertex_labels) or self.vertex_labels[vertex_id] is None:
+            raise ValueError(f"Vertex ID {vertex_id} not found in the graph.")
+        return self.vertex_labels[vertex_id]
+
+    def id_bound(self) -> int:
+        """
+        Returns an upper bound (exclusive) for vertex IDs, the size needed
+        for flat lists indexed by vertex ID.
+        :return:`int`
+        """
+        return len(self.vertex_labels)
+
+    def iter_neighbour_ids(self, vertex_id: int):
+        """
+        ID-based version of `iter_neighbours`: returns an iterator of `(neighbor_id, weight)` pairs.
+        Reads the cached CSR snapshot, whose IDs are the interned IDs while no ID is freed.
+        Time Complexity: O(1) per edge, plus O(V + E) once per graph version for the snapshot
+        :return: iterator of `tuple`
+        """
+        if not self._free_ids:
+            self.vertex_label(vertex_id)
+            return self.to_csr().iter_edges(vertex_id)
+        ids = self.vertex_ids
+        return ((ids[neighbor], weight) for neighbor, weight in self.iter_neighbours(self.vertex_label(vertex_id)))
+
+    def _component_index(self) -> DisjointSet:
+        """
+        Returns the connectivity index, rebuilding it if a deletion made it stale.
+        Without `track_components` a temporary index is built on every call.
+        Time Complexity: O(1) when up to date, O(V + E) to rebuild
+        """
+        if self.components is not None and not self._components_stale:
+            return self.components
+        components = DisjointSet(self.graph_repo)
+        for vertex, neighbors in self.graph_repo.items():
+            for neighbor in neighbors:
+                components.union(vertex, neighbor)
+        if self.components is not None:
+            self.components = components
+            self._components_stale = False
+        return components
+
+    def is_connected(self) -> bool:
+        """
+        Checks if the graph has a single connected component (weakly connected for directed graphs).
+        Time Complexity: O(1) with an up-to-date connectivity index
+        :return:`bool`
+        """
+        if not self.graph_repo:
+            raise ValueError("Graph is empty")
+        return self._component_index().set_count == 1
+
+    def component_count(self) -> int:
+        """
+        Returns the number of connected components (weakly connected for directed graphs).
+        Time Complexity: O(1) with an up-to-date connectivity index
+        :return:`int`
+        """
+        return self._component_index().set_count
+
+    def same_component(self, vertex1, vertex2) -> bool:
+        """
+        Checks if two vertices are in the same connected component (weakly connected for directed graphs).
+        Time Complexity: O(α(V)) with an up-to-date connectivity index
+        :return:`bool`
+        """
+        if vertex1 not in self.graph_repo or vertex2 not in self.graph_repo:
+            raise ValueError(f"One or both vertices '{vertex1}' and '{vertex2}' are not in the graph.")
+        return self._component_index().connected(vertex1, vertex2)
 
     def get_v(self) -> int:
         """
@@ -211,11 +453,16 @@ class SimpleDirectedGraph:
         if self.is_directed:
             return sum(len(neighbors) for neighbors in self.graph_repo.values())
         else:
-            return sum(len(neighbors) for neighbors in self.graph_repo.values()) // 2
+            arcs = sum(len(neighbors) for neighbors in self.graph_repo.values())
+            if self.adjacency == "set":
+                # count an undirected self-loop twice, like the two entries list mode stores
+                arcs += sum(1 for vertex, neighbors in self.graph_repo.items() if vertex in neighbors)
+            return arcs // 2
 
     def is_edge(self, vertex1, vertex2) -> bool:
         """
         Checks if there is an edge from vertex1 to vertex2.
+        Time Complexity: O(1) in "set" adjacency mode, O(deg) in "list" mode
         :return:`bool`
         """
         if self.is_directed:
@@ -231,21 +478,89 @@ class SimpleDirectedGraph:
         """
         if vertex_name not in self.graph_repo:
             raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
-        return copy.deepcopy(self.graph_repo[vertex_name])
+        return copy.deepcopy(list(self.graph_repo[vertex_name]))
+
+    def neighbours_view(self, vertex_name):
+        """
+        Returns a live, read-only view of the neighbors of a given vertex without copying them:
+        a `NeighbourView` in "list" adjacency mode, a keys view in "set" mode.
+        Time Complexity: O(1)
+        :return:`NeighbourView` or `dict_keys`
+        """
+        if vertex_name not in self.graph_repo:
+            raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
+        neighbors = self.graph_repo[vertex_name]
+        if self.adjacency == "set":
+            return neighbors.keys()
+        return NeighbourView(neighbors)
+
+    def iter_neighbours(self, vertex_name):
+        """
+        Returns an iterator of `(neighbor, weight)` pairs for a given vertex, without copying.
+        The weight is `None` when the graph is unweighted.
+        The graph must not be modified while the iterator is consumed.
+        :return: iterator of `tuple`
+        """
+        if vertex_name not in self.graph_repo:
+            raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
+        neighbors = self.graph_repo[vertex_name]
+        if self.is_weighted:
+            weights = self.graph_weight_repo[vertex_name]
+            return ((neighbor, weights[neighbor]) for neighbor in neighbors)
+        return ((neighbor, None) for neighbor in neighbors)
 
     def inbound_neighbours(self, vertex_name) -> list:
         """
         Returns a list of all inbound neighbors.
         For undirected graphs, this is equivalent to the neighbours.
+        Time Complexity: O(in-degree) with the incoming-edge index, O(V + E) without it
         :return : `list`
         """
         if self.is_directed:
             if vertex_name not in self.graph_repo:
                 raise ValueError(f"Vertex '{vertex_name}' not found in the graph.")
+            if self.inbound_repo is not None:
+                return list(self.inbound_repo[vertex_name])
             return [key for key, neighbors in self.graph_repo.items() if vertex_name in neighbors]
         else:
             return self.neighbours(vertex_name)
 
+    def iter_inbound_neighbours(self, vertex_name):
+        """
+        Returns an iterator of `(source, weight)` pairs for every edge source -> vertex_name.
+        The weight is `None` when the graph is unweighted.
+        For undirected graphs, this is equivalent to `iter_neighbours`.
+        Time Complexity: O(in-degree) with the incoming-edge index, O(V + E) without it
+        :return: iterator of `tuple`
+        """
+        if not self.is_directed:
+            return self.iter_neighbours(vertex_name)
+        sources = self.inbound_neighbours(vertex_name)
+        if self.is_weighted:
+            weights = self.graph_weight_repo
+            return ((source, weights[source][vertex_name]) for source in sources)
+        return ((source, None) for source in sources)
+
+    def inbound_expander(self):
+        """
+        Returns a function mapping a vertex of the graph to its `(source, weight)` inbound
+        pairs, for searches that expand many vertices backwards. A directed graph without
+        the incoming-edge index gets a reverse adjacency built once, instead of the scan of
+        the whole graph that `iter_inbound_neighbours` makes per vertex.
+        Later changes to the graph are not reflected in the reverse adjacency.
+        Time Complexity: O(V + E) without the incoming-edge index, O(1) otherwise
+        :return: callable
+        """
+        if not self.is_directed or self.inbound_repo is not None:
+            return self.iter_inbound_neighbours
+        weights = self.graph_weight_repo if self.is_weighted else None
+        reverse = {vertex: [] for vertex in self.graph_repo}
+        for vertex, neighbors in self.graph_repo.items():
+            row = weights.get(vertex, {}) if weights is not None else None
+            for neighbor in neighbors:
+                reverse[neighbor].append((vertex, row[neighbor] if row is not None else None))
+        return reverse.__getitem__
+
     def return_vertices_list(self) -> list:
         """
         Returns a list of all vertices.
@@ -285,6 +600,27 @@ class SimpleDirectedGraph:
             raise ValueError(f"Invalid data for start vertex :{start_vertex}, not part of the graph")
         return BFSIterator(self, start_vertex)
 
+    def bfs_levels(self, start_vertices, max_depth: int = None, stop=None) -> LevelBFSIterator:
+        """
+        Returns a level-synchronous BFS iterator from one or more start vertices,
+        yielding `(depth, frontier)` batches. Memory is bounded by the visited set and
+        one frontier, so k-hop queries only touch the k-hop neighbourhood.
+        :param start_vertices: iterable of start vertices
+        :param max_depth: last depth to yield, unbounded by default
+        :param stop: optional predicate; iteration ends after the first level containing
+        a vertex it accepts
+        :return: `LevelBFSIterator`
+        """
+        return LevelBFSIterator(self, start_vertices, max_depth, stop)
+
+    def reachable_within(self, start_vertices, hops: int) -> set:
+        """
+        Returns the vertices reachable from any start vertex in at most `hops` edges.
+        Time Complexity: O(V' + E') over the vertices and edges within `hops`
+        :return: `set`
+        """
+        return {vertex for _, frontier in self.bfs_levels(start_vertices, hops) for vertex in frontier}
+
     def dfs_iter(self, start_vertex):
         """
         Returns a Depth-First Search iterator starting from the given vertex.
@@ -293,11 +629,61 @@ class SimpleDirectedGraph:
             raise ValueError(f"Invalid data for start vertex :{start_vertex}, not part of the graph")
         return DFSIterator(self, start_vertex)
 
+    def to_csr(self) -> CSRGraph:
+        """
+        Returns an immutable, array-backed CSR snapshot of the graph with integer vertex IDs.
+        Later changes to the graph are not reflected in the snapshot. The snapshot is
+        cached and only rebuilt after the graph has changed.
+        Time Complexity: O(1) when cached, O(V + E) to rebuild
+        :return: `CSRGraph`
+        """
+        if self._csr_cache is None or self._csr_cache[0] != self.version:
+            self._csr_cache = (self.version, CSRGraph.from_graph(self))
+        return self._csr_cache[1]
+
+    def freeze(self) -> CSRGraph:
+        """
+        Alias of `to_csr`.
+        :return: `CSRGraph`
+        """
+        return self.to_csr()
+
+    def to_bitset(self) -> BitsetAdjacency:
+        """
+        Returns a bitset adjacency over the interned vertex IDs for dense-graph kernels.
+        The bitsets are cached and only rebuilt after the graph has changed.
+        Time Complexity: O(1) when cached, O(V + E) to rebuild
+        :return: `BitsetAdjacency`
+        """
+        if self._bitset_cache is None or self._bitset_cache[0] != self.version:
+            self._bitset_cache = (self.version, BitsetAdjacency.from_graph(self))
+        return self._bitset_cache[1]
+
+    def save_binary(self, file_path: str) -> None:
+        """
+        Writes the graph to a compact binary file (header, vertex-name table, CSR offsets,
+        targets and weights) that `load_binary` can memory-map.
+        Time Complexity: O(V + E)
+        :return: `None`
+        """
+        self.to_csr().save_binary(file_path)
+
+    @staticmethod
+    def load_binary(file_path: str) -> CSRGraph:
+        """
+        Memory-maps a file written by `save_binary` and returns a read-only CSR snapshot
+        backed by the file. Use `CSRGraph.thaw()` to get a mutable SimpleDirectedGraph.
+        Time Complexity: O(1)
+        :return: `CSRGraph`
+        """
+        return CSRGraph.load_binary(file_path)
+
     @classmethod
-    def create_from_file(cls, file_path: str) -> "SimpleDirectedGraph":
+    def create_from_file(cls, file_path: str, **options) -> "SimpleDirectedGraph":
         """
         Creates a graph from a file with the given format:
         :param file_path: Path to the input file.
+        :param options: Constructor options, e.g. `track_inbound=True`
         :return: A graph of type SimpleDirectedGraph
         """
         with open(file_path, "r") as file:
@@ -311,7 +697,7 @@ class SimpleDirectedGraph:
         is_directed = (graph_type[0] == "directed")
         is_weighted = (graph_type[1] == "weighted")
 
-        graph = cls()
+        graph = cls(**options)
         if is_directed:
             graph.change_if_directed()
         if is_weighted:
@@ -350,6 +736,128 @@ class SimpleDirectedGraph:
 
         return graph
 
+    @classmethod
+    def load_from_file(cls, file_path: str, buffer_size: int = 1 << 20, progress=None,
+                       **options) -> "SimpleDirectedGraph":
+        """
+        Streaming version of `create_from_file` for large edge lists.
+        The file is read in binary chunks of `buffer_size` bytes, and the adjacency and
+        weight structures are built in a single pass with O(1) duplicate-edge checks,
+        so memory stays bounded by the graph itself, not the file.
+        Accepts the same format and raises the same errors as `create_from_file`.
+        Time Complexity: O(V + E)
+        :param file_path: Path to the input file.
+        :param buffer_size: Number of bytes read per chunk.
+        :param progress: Optional callable `progress(bytes_read, total_bytes, lines_read)`,
+        called once per chunk.
+        :param options: Constructor options, e.g. `adjacency="set"`
+        :return: A graph of type SimpleDirectedGraph
+        """
+        graph = cls(**options)
+        total_bytes = os.path.getsize(file_path)
+        rows = {}
+        # vertices with an undirected self-loop, which `add_edge` links twice in list mode
+        self_loops = set()
+        is_directed = is_weighted = None
+        bytes_read = 0
+        lines_read = 0
+        pending = b""
+
+        with open(file_path, "rb") as file:
+            while True:
+                chunk = file.read(buffer_size)
+                bytes_read += len(chunk)
+                if chunk:
+                    data = pending + chunk
+                    cut = data.rfind(b"\n") + 1
+                    if cut == 0:
+                        pending = data
+                        continue
+                    pending = data[cut:]
+                    text = data[:cut].decode()
+                else:
+                    text = pending.decode()
+                    pending = b""
+
+                lines = text.splitlines()
+                if is_directed is None and lines:
+                    graph_type = lines[0].strip().split()
+                    if len(graph_type) != 2 or graph_type[0] not in {"directed", "undirected"} or \
+                            graph_type[1] not in {"weighted", "unweighted"}:
+                        raise ValueError("Invalid graph type specification in the first line of the file.")
+                    is_directed = (graph_type[0] == "directed")
+                    is_weighted = (graph_type[1] == "weighted")
+                    lines = lines[1:]
+
+                for line in lines:
+                    parts = line.split()
+                    count = len(parts)
+                    if count == 1:
+                        if parts[0] not in rows:
+                            rows[parts[0]] = {}
+                        continue
+                    if count == 2:
+                        if is_weighted:
+                            raise ValueError(
+                                f"Invalid line format: {line.strip()} (expected 3 numbers for a weighted graph)")
+                        vertex1, vertex2 = parts
+                        weight = None
+                    elif count == 3:
+                        vertex1, vertex2, weight = parts
+                        weight = int(weight)
+                        if not is_weighted:
+                            raise ValueError(
+                                f"Invalid line format: {line.strip()} (expected 2 numbers for an unweighted graph)")
+                    else:
+                        raise ValueError(f"Invalid line format: {line.strip()}")
+
+                    row1 = rows.get(vertex1)
+                    if row1 is None:
+                        row1 = rows[vertex1] = {}
+                    row2 = rows.get(vertex2)
+                    if row2 is None:
+                        row2 = rows[vertex2] = {}
+                    if vertex2 in row1:
+                        raise ValueError(f"Edge from '{vertex1}' to '{vertex2}' already exists.")
+                    row1[vertex2] = weight
+                    if not is_directed:
+                        row2[vertex1] = weight
+                        if vertex1 == vertex2:
+                            self_loops.add(vertex1)
+
+                lines_read += len(lines)
+                if progress is not None:
+                    progress(bytes_read, total_bytes, lines_read)
+                if not chunk:
+                    break
+
+        if is_directed is None:
+            raise ValueError("Invalid graph type specification in the first line of the file.")
+
+        if is_directed:
+            graph.change_if_directed()
+        if is_weighted:
+            graph.change_if_weighted()
+
+        for vertex, row in rows.items():
+            if graph.adjacency == "set":
+                graph.graph_repo[vertex] = dict.fromkeys(row) if is_weighted else row
+            elif vertex in self_loops:
+                graph.graph_repo[vertex] = [neighbor for neighbor in row
+                                            for _ in range(2 if neighbor == vertex else 1)]
+            else:
+                graph.graph_repo[vertex] = list(row)
+            if is_weighted:
+                graph.graph_weight_repo[vertex] = row
+        for vertex in rows:
+            graph._intern(vertex)
+        graph._rebuild_inbound()
+        graph._components_stale = True
+        graph.version += 1
+
+        return graph
+
+
 
 if __name__ == "__main__":
     pass
@@ -0,0 +1,114 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+
+class SearchMetrics:
+    """
+    Shared instrumentation for the search algorithms.
+    Pass an instance as `metrics=` to `Djkstra.dijkstra`, `UCS.uniform_cost_search` or
+    `UCS2.uniform_cost_search` to collect counters, phase timings, a frontier-size
+    histogram and the peak traced memory. One instance can be reused across runs,
+    in which case the counters and timings accumulate.
+    Without an instance the algorithms only pay a `None` check per heap pop.
+    """
+
+    def __init__(self, track_frontier: bool = True, track_memory: bool = False) -> None:
+        """
+        :param track_frontier: record the priority queue size after every pop
+        :param track_memory: trace allocations with `tracemalloc` to report the peak memory (slow)
+        """
+        self.track_frontier = track_frontier
+        self.track_memory = track_memory
+        self.counters = {}
+        self.phases = {}
+        # power-of-two bucket upper bound -> number of observed frontier sizes in the bucket
+        self.frontier_histogram = {}
+        self.peak_memory = 0
+        self.runs = 0
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Adds value to a named counter.
+        :return: `None`
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def record_frontier(self, size: int) -> None:
+        """
+        Records one frontier size in the histogram.
+        :return: `None`
+        """
+        bucket = 1 << size.bit_length() if size else 0
+        self.frontier_histogram[bucket] = self.frontier_histogram.get(bucket, 0) + 1
+
+    def frontier_recorder(self):
+        """
+        Returns the callable to use in a hot loop, or `None` when the frontier is not tracked.
+        """
+        return self.record_frontier if self.track_frontier else None
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Context manager timing a named phase with `time.perf_counter`, in milliseconds.
+        """
+        owns_tracing = False
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                owns_tracing = True
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            if self.track_memory:
+                self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+                if owns_tracing:
+                    tracemalloc.stop()
+
+    def to_dict(self) -> dict:
+        """
+        Exports the collected metrics.
+        :return: `dict`
+        """
+        return {
+            "runs": self.runs,
+            "counters": dict(self.counters),
+            "phases_ms": dict(self.phases),
+            "frontier_histogram": {str(bucket): count for bucket, count in sorted(self.frontier_histogram.items())},
+            "peak_memory_bytes": self.peak_memory if self.track_memory else None,
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Exports the collected metrics as a JSON string.
+        :return: `str`
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def phase(metrics, name: str):
+    """
+    Returns `metrics.phase(name)`, or a no-op context manager when metrics is `None`.
+    """
+    if metrics is None:
+        return nullcontext()
+    return metrics.phase(name)
+
+
+def report(metrics, cost_calls: int, heap_pushes: int, heap_pops: int) -> None:
+    """
+    Adds the standard search counters of one run to metrics, if given.
+    :return: `None`
+    """
+    if metrics is None:
+        return
+    metrics.runs += 1
+    metrics.count("cost_calls", cost_calls)
+    metrics.count("heap_pushes", heap_pushes)
+    metrics.count("heap_pops", heap_pops)
@@ -1,3 +1,6 @@
+from collections import deque
+
+
 
 class BFSIterator:
     def __init__(self, graph, start_vertex):
@@ -5,20 +8,19 @@ class BFSIterator:
             raise ValueError(f"Start vertex '{start_vertex}' is not in the graph.")
 
         self.graph = graph
-        self.queue = [(start_vertex, 0)]
+        # consumed entries are popped, so the queue only holds the current frontier
+        self.queue = deque([(start_vertex, 0)])
         self.visited = set()
         self.visited.add(start_vertex)
-        self.queue_front = 0
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if self.queue_front >= len(self.queue):
+        if not self.queue:
             raise StopIteration
 
-        current_vertex, current_distance = self.queue[self.queue_front]
-        self.queue_front += 1
+        current_vertex, current_distance = self.queue.popleft()
 
         for neighbor in self.graph.graph_repo[current_vertex]:
             if neighbor not in self.visited:
@@ -54,3 +56,183 @@ class DFSIterator:
                 return current_vertex, current_depth
 
         raise StopIteration
+
+
+class CSRBFSIterator:
+    def __init__(self, csr, start_id):
+        if not 0 <= start_id < csr.get_v():
+            raise ValueError(f"Start vertex ID {start_id} is not in the graph.")
+
+        self.csr = csr
+        self.queue = deque([(start_id, 0)])
+        self.visited = bytearray(csr.get_v())
+        self.visited[start_id] = 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.queue:
+            raise StopIteration
+
+        current_vertex, current_distance = self.queue.popleft()
+
+        offsets = self.csr.offsets
+        for neighbor in self.csr.targets[offsets[current_vertex]:offsets[current_vertex + 1]]:
+            if not self.visited[neighbor]:
+                self.visited[neighbor] = 1
+                self.queue.append((neighbor, current_distance + 1))
+
+        return current_vertex, current_distance
+
+
+class CSRDFSIterator:
+    def __init__(self, csr, start_id):
+        if not 0 <= start_id < csr.get_v():
+            raise ValueError(f"Start vertex ID {start_id} is not in the graph.")
+
+        self.csr = csr
+        self.stack = [(start_id, 0)]
+        self.visited = bytearray(csr.get_v())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+
+        while self.stack:
+            current_vertex, current_depth = self.stack.pop()
+            if not self.visited[current_vertex]:
+                self.visited[current_vertex] = 1
+
+                offsets = self.csr.offsets
+                for neighbor in reversed(self.csr.targets[offsets[current_vertex]:offsets[current_vertex + 1]]):
+                    if not self.visited[neighbor]:
+                        self.stack.append((neighbor, current_depth + 1))
+
+                return current_vertex, current_depth
+
+        raise StopIteration
+
+
+class LevelBFSIterator:
+    """
+    Level-synchronous, multi-source BFS: yields `(depth, frontier)` with the list of all
+    vertices at each depth from the nearest start vertex. Only the visited set and the
+    current frontier are kept; a frontier is dropped once the next one is built.
+    The next level is only expanded when it is requested.
+    Iteration ends after level `max_depth`, or after the first level containing a vertex
+    for which `stop(vertex)` is true; that vertex is stored in `found`.
+    """
+
+    def __init__(self, graph, start_vertices, max_depth=None, stop=None):
+        start_vertices = list(dict.fromkeys(start_vertices))
+        if not start_vertices:
+            raise ValueError("At least one start vertex is required.")
+        for start_vertex in start_vertices:
+            if start_vertex not in graph.graph_repo:
+                raise ValueError(f"Start vertex '{start_vertex}' is not in the graph.")
+
+        self.graph = graph
+        self.frontier = start_vertices
+        self.visited = set(start_vertices)
+        self.depth = 0
+        self.max_depth = max_depth
+        self.stop = stop
+        self.found = None
+        self.expand = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.expand:
+            next_frontier = []
+            graph_repo = self.graph.graph_repo
+            visited = self.visited
+            for vertex in self.frontier:
+                for neighbor in graph_repo[vertex]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+            self.frontier = next_frontier
+            self.depth += 1
+
+        if not self.frontier:
+            raise StopIteration
+
+        self.expand = True
+        if self.stop is not None:
+            for vertex in self.frontier:
+                if self.stop(vertex):
+                    self.found = vertex
+                    return self._finish()
+        if self.max_depth is not None and self.depth >= self.max_depth:
+            return self._finish()
+        return self.depth, self.frontier
+
+    def _finish(self):
+        frontier = self.frontier
+        self.frontier = []
+        self.expand = False
+        return self.depth, frontier
+
+
+class CSRLevelBFSIterator:
+    """
+    `LevelBFSIterator` over the vertex IDs of a CSR snapshot, with a bytearray visited set.
+    """
+
+    def __init__(self, csr, start_ids, max_depth=None, stop=None):
+        start_ids = list(dict.fromkeys(start_ids))
+        if not start_ids:
+            raise ValueError("At least one start vertex is required.")
+        self.visited = bytearray(csr.get_v())
+        for start_id in start_ids:
+            if not 0 <= start_id < csr.get_v():
+                raise ValueError(f"Start vertex ID {start_id} is not in the graph.")
+            self.visited[start_id] = 1
+
+        self.csr = csr
+        self.frontier = start_ids
+        self.depth = 0
+        self.max_depth = max_depth
+        self.stop = stop
+        self.found = None
+        self.expand = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.expand:
+            next_frontier = []
+            offsets = self.csr.offsets
+            targets = self.csr.targets
+            visited = self.visited
+            for vertex in self.frontier:
+                for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        next_frontier.append(neighbor)
+            self.frontier = next_frontier
+            self.depth += 1
+
+        if not self.frontier:
+            raise StopIteration
+
+        self.expand = True
+        if self.stop is not None:
+            for vertex in self.frontier:
+                if self.stop(vertex):
+                    self.found = vertex
+                    return self._finish()
+        if self.max_depth is not None and self.depth >= self.max_depth:
+            return self._finish()
+        return self.depth, self.frontier
+
+    def _finish(self):
+        frontier = self.frontier
+        self.frontier = []
+        self.expand = False
+        return self.depth, frontier
@@ -0,0 +1,103 @@
+import sys
+from collections import OrderedDict
+
+from Djkstra import dijkstra
+
+
+class ShortestPathCache:
+    """
+    Bounded LRU cache of single-source shortest-path results over one graph.
+    Entries are keyed by source vertex and graph version: any mutation of the graph
+    bumps `graph.version`, and the next lookup drops every stale entry, so a cached
+    answer is never served for a graph that has changed.
+    The cached dicts are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, graph, algorithm=dijkstra, max_entries: int = 128, max_bytes: int = None) -> None:
+        """
+        :param graph: `SimpleDirectedGraph`
+        :param algorithm: callable `algorithm(graph, source)` returning `(distances, previous, ...)`,
+        e.g. `Djkstra.dijkstra` or `UCS.uniform_cost_search`
+        :param max_entries: maximum number of cached sources
+        :param max_bytes: optional limit on the estimated memory of the cached results
+        """
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry.")
+        self.graph = graph
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.version = graph.version
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, source):
+        """
+        Returns `(distances, previous)` for a source vertex, computing it on a miss.
+        Time Complexity: O(1) on a hit, one run of the algorithm on a miss
+        :return: `tuple`
+        """
+        if self.graph.version != self.version:
+            self.invalidations += len(self.entries)
+            self.clear()
+            self.version = self.graph.version
+
+        entry = self.entries.get(source)
+        if entry is not None:
+            self.entries.move_to_end(source)
+            self.hits += 1
+            return entry[0], entry[1]
+
+        self.misses += 1
+        distances, previous = self.algorithm(self.graph, source)[:2]
+        size = _estimate_size(distances) + _estimate_size(previous)
+        if self.max_bytes is None or size <= self.max_bytes:
+            self.entries[source] = (distances, previous, size)
+            self.bytes_used += size
+            self._evict()
+        return distances, previous
+
+    def _evict(self) -> None:
+        """
+        Drops least recently used entries until the size and memory limits hold.
+        """
+        while len(self.entries) > self.max_entries or \
+                (self.max_bytes is not None and self.bytes_used > self.max_bytes):
+            _, (_, _, size) = self.entries.popitem(last=False)
+            self.bytes_used -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes every cached entry, keeping the statistics.
+        :return: `None`
+        """
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the hit, miss, eviction and invalidation counters and the current usage.
+        :return: `dict`
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self.entries),
+            "bytes": self.bytes_used,
+        }
+
+
+def _estimate_size(result: dict) -> int:
+    """
+    Estimates the memory of a result dict: the table itself plus the numeric values it owns.
+    Keys are the graph's own vertex labels and are not counted.
+    """
+    return sys.getsizeof(result) + sum(sys.getsizeof(value) for value in result.values()
+                                       if isinstance(value, (int, float)))
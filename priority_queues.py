@@ -0,0 +1,210 @@
+import heapq
+from functools import partial
+
+# Priority queue backends for the shortest-path functions.
+# Every backend has the same interface: `push((priority, item))`, `pop() -> (priority, item)`
+# and `len()`. Lazy backends keep duplicate entries that the search skips as stale;
+# decrease-key backends update the entry of an item that is already queued instead.
+
+
+class HeapQueue:
+    """
+    Binary heap with lazy deletion (`heapq`), the default backend.
+    push and pop are bound directly to the `heapq` C functions.
+    Time Complexity: O(log n) per operation
+    """
+    decreases_keys = False
+
+    def __init__(self) -> None:
+        self.heap = []
+        self.push = partial(heapq.heappush, self.heap)
+        self.pop = partial(heapq.heappop, self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class DialBucketQueue:
+    """
+    Dial's bucket queue for non-negative integer weights up to `max_weight`.
+    Uses max_weight + 1 circular buckets; priorities must never decrease below the
+    last popped one, which holds for Dijkstra.
+    Time Complexity: O(1) per push, O(max_weight) worst case per pop
+    """
+    decreases_keys = False
+
+    def __init__(self, max_weight: int) -> None:
+        self.buckets = [[] for _ in range(max_weight + 1)]
+        self.current = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, entry) -> None:
+        priority = entry[0]
+        if priority < self.current:
+            raise ValueError("Dial's bucket queue requires monotone priorities.")
+        self.buckets[priority % len(self.buckets)].append(entry)
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty priority queue")
+        bucket_count = len(self.buckets)
+        while not self.buckets[self.current % bucket_count]:
+            self.current += 1
+        self.size -= 1
+        return self.buckets[self.current % bucket_count].pop()
+
+
+class RadixHeap:
+    """
+    Radix heap for non-negative integer priorities that never decrease below the last popped one.
+    Bucket i holds entries whose priority differs from the last popped priority in bit i - 1 at most.
+    Time Complexity: O(1) per push, O(log C) amortised per pop
+    """
+    decreases_keys = False
+
+    def __init__(self) -> None:
+        self.buckets = [[]]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, entry) -> None:
+        priority = entry[0]
+        if priority < self.last:
+            raise ValueError("Radix heap requires monotone priorities.")
+        index = (priority ^ self.last).bit_length()
+        while len(self.buckets) <= index:
+            self.buckets.append([])
+        self.buckets[index].append(entry)
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty priority queue")
+        if not self.buckets[0]:
+            index = 1
+            while not self.buckets[index]:
+                index += 1
+            entries = self.buckets[index]
+            self.buckets[index] = []
+            self.last = min(entry[0] for entry in entries)
+            for entry in entries:
+                self.buckets[(entry[0] ^ self.last).bit_length()].append(entry)
+        self.size -= 1
+        return self.buckets[0].pop()
+
+
+class IndexedBinaryHeap:
+    """
+    Binary heap with a position index, supporting decrease-key for any comparable priorities.
+    Pushing an item that is already queued lowers its priority if the new one is smaller,
+    so the heap never holds stale entries.
+    Time Complexity: O(log n) per operation
+    """
+    decreases_keys = True
+
+    def __init__(self) -> None:
+        self.heap = []
+        self.positions = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, entry) -> None:
+        priority, item = entry
+        position = self.positions.get(item)
+        if position is None:
+            self.heap.append(entry)
+            self.positions[item] = len(self.heap) - 1
+            self._sift_up(len(self.heap) - 1)
+        elif priority < self.heap[position][0]:
+            self.heap[position] = entry
+            self._sift_up(position)
+
+    def pop(self):
+        if not self.heap:
+            raise IndexError("pop from an empty priority queue")
+        top = self.heap[0]
+        last = self.heap.pop()
+        del self.positions[top[1]]
+        if self.heap:
+            self.heap[0] = last
+            self.positions[last[1]] = 0
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, position: int) -> None:
+        heap = self.heap
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[parent][0] <= entry[0]:
+                break
+            heap[position] = heap[parent]
+            self.positions[heap[position][1]] = position
+            position = parent
+        heap[position] = entry
+        self.positions[entry[1]] = position
+
+    def _sift_down(self, position: int) -> None:
+        heap = self.heap
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if entry[0] <= heap[child][0]:
+                break
+            heap[position] = heap[child]
+            self.positions[heap[position][1]] = position
+            position = child
+        heap[position] = entry
+        self.positions[entry[1]] = position
+
+
+QUEUES = ("heap", "dial", "radix", "indexed")
+
+
+def _max_integer_weight(graph) -> int:
+    """
+    Returns the largest edge weight, checking that every weight is a non-negative integer.
+    Works on a SimpleDirectedGraph or a CSRGraph.
+    """
+    if hasattr(graph, "graph_weight_repo"):
+        weights = (weight for row in graph.graph_weight_repo.values() for weight in row.values())
+    else:
+        weights = iter(graph.weights)
+    max_weight = 0
+    for weight in weights:
+        if not isinstance(weight, int) or weight < 0:
+            raise ValueError("Dial's and radix queues require non-negative integer weights.")
+        if weight > max_weight:
+            max_weight = weight
+    return max_weight
+
+
+def make_queue(kind: str, graph):
+    """
+    Creates a priority queue backend for a search over the given graph.
+    :param kind: "heap", "dial", "radix" or "indexed"
+    :return: queue object
+    """
+    if kind == "heap":
+        return HeapQueue()
+    if kind == "dial":
+        return DialBucketQueue(_max_integer_weight(graph))
+    if kind == "radix":
+        _max_integer_weight(graph)
+        return RadixHeap()
+    if kind == "indexed":
+        return IndexedBinaryHeap()
+    raise ValueError(f"Unknown priority queue '{kind}', expected one of {', '.join(QUEUES)}.")
@@ -1,6 +1,34 @@
+import json
+import os
+import random
+import tempfile
 import unittest
+from unittest import mock
 from domain import SimpleDirectedGraph
 from iterator import DFSIterator, BFSIterator
+from Djkstra import dijkstra, dijkstra_csr, dijkstra_many, bidirectional_dijkstra
+from DeltaStepping import delta_stepping
+from UCS import uniform_cost_search, uniform_cost_search_csr
+from AStar import a_star, ALTHeuristic
+from ContractionHierarchy import ContractionHierarchy
+from path_cache import ShortestPathCache
+from instrumentation import SearchMetrics
+import UCS2
+import benchmark
+from disjoint_set import DisjointSet
+from Assigement4 import min_spanning_tree
+from Boruvka import minimum_spanning_forest
+import Assigment6
+from Assigment6 import find_maximum_cliques_backtracking, find_maximum_cliques, find_maximal_cliques, count_triangles
+from bitset import iter_bits, to_mask
+from Assigment5 import check_if_eul, get_eul_circuit, get_eul_path, find_eulerian_trail
+try:
+    import numpy as np
+    import vectorized
+    import APSP
+    from APSP import all_pairs_shortest_paths, DistanceMatrix
+except ImportError:
+    vectorized = None
 
 
 class TestGraph(unittest.TestCase):
@@ -62,6 +90,31 @@ class TestGraph(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.graph.bfs_iter("6")
 
+    def test_bfs_levels(self):
+        for v1, v2 in [("1", "2"), ("2", "3"), ("3", "4"), ("1", "5")]:
+            self.graph.add_edge(v1, v2)
+        self.graph.add_vertex("6")
+
+        levels = [(depth, sorted(frontier)) for depth, frontier in self.graph.bfs_levels(["1"])]
+        self.assertEqual(levels, [(0, ["1"]), (1, ["2", "5"]), (2, ["3"]), (3, ["4"])])
+        levels = [(depth, sorted(frontier)) for depth, frontier in self.graph.bfs_levels(["4", "5"])]
+        self.assertEqual(levels, [(0, ["4", "5"]), (1, ["1", "3"]), (2, ["2"])])
+
+        self.assertEqual(self.graph.reachable_within(["2"], 1), {"1", "2", "3"})
+        self.assertEqual(self.graph.reachable_within(["6"], 5), {"6"})
+
+        levels = self.graph.bfs_levels(["1"], stop=lambda vertex: vertex == "3")
+        self.assertEqual([depth for depth, _ in levels], [0, 1, 2])
+        self.assertEqual(levels.found, "3")
+
+        csr = self.graph.to_csr()
+        csr_levels = [(depth, sorted(csr.vertex_label(v) for v in frontier))
+                      for depth, frontier in csr.bfs_levels(["1"], max_depth=2)]
+        self.assertEqual(csr_levels, [(0, ["1"]), (1, ["2", "5"]), (2, ["3"])])
+
+        with self.assertRaises(ValueError):
+            self.graph.bfs_levels(["1", "7"])
+
     def test_dfs_iter(self):
         self.graph.add_edge("1", "2", 5)
         self.graph.add_edge("2", "3", 10)
@@ -107,6 +160,34 @@ class TestGraph(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.graph.get_weight("1", "2")
 
+    def test_neighbour_views(self):
+        self.graph.change_if_weighted()
+        self.graph.add_edge("1", "2", 5)
+        self.graph.add_edge("1", "3", 2)
+        view = self.graph.neighbours_view("1")
+        self.assertEqual(list(view), ["2", "3"])
+        self.assertEqual((len(view), view[0], "3" in view), (2, "2", True))
+        self.assertFalse(hasattr(view, "append"))
+        self.assertEqual(list(self.graph.iter_neighbours("1")), [("2", 5), ("3", 2)])
+        self.graph.add_edge("1", "4", 1)
+        self.assertEqual(list(view), ["2", "3", "4"])
+
+        with self.assertRaises(ValueError):
+            self.graph.iter_neighbours("6")
+
+    def test_vertex_ids(self):
+        self.assertEqual([self.graph.vertex_id(v) for v in ["1", "2", "3", "4", "5"]], [0, 1, 2, 3, 4])
+        self.assertEqual(self.graph.vertex_label(2), "3")
+        self.graph.add_edge("1", "2")
+        self.assertEqual(list(self.graph.iter_neighbour_ids(0)), [(1, None)])
+
+        self.graph.remove_vertex("3")
+        with self.assertRaises(ValueError):
+            self.graph.vertex_label(2)
+        self.graph.add_vertex("6")
+        self.assertEqual(self.graph.vertex_id("6"), 2)
+        self.assertEqual(self.graph.id_bound(), 5)
+
     def test_return_vertices_list(self):
         self.assertEqual(sorted(self.graph.return_vertices_list()), sorted(["1", "2", "3", "4", "5"]))
 
@@ -127,5 +208,765 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(graph.get_weight("2", "3"), 10)
 
 
+class TestStreamingLoader(unittest.TestCase):
+
+    def write(self, content):
+        handle, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as file:
+            file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_matches_create_from_file(self):
+        path = self.write("directed weighted\n1 2 5\n2 3 10\n3 1 -2\n7\n4 3 1\n")
+        expected = SimpleDirectedGraph.create_from_file(path)
+        reports = []
+        graph = SimpleDirectedGraph.load_from_file(path, buffer_size=4,
+                                                   progress=lambda *args: reports.append(args))
+        self.assertEqual(graph.graph_repo, expected.graph_repo)
+        self.assertEqual(graph.graph_weight_repo, expected.graph_weight_repo)
+        self.assertTrue(graph.is_directed and graph.is_weighted)
+        self.assertEqual(reports[-1][0], os.path.getsize(path))
+        self.assertEqual(reports[-1][2], 5)
+
+    def test_undirected_self_loop(self):
+        path = self.write("undirected weighted\n1 1 4\n1 2 3\n")
+        expected = SimpleDirectedGraph.create_from_file(path)
+        graph = SimpleDirectedGraph.load_from_file(path)
+        self.assertEqual(graph.graph_repo, expected.graph_repo)
+        self.assertEqual(graph.graph_repo["1"], ["1", "1", "2"])
+        self.assertEqual(graph.graph_weight_repo, expected.graph_weight_repo)
+
+    def test_set_adjacency(self):
+        path = self.write("undirected unweighted\n1 2\n2 3")
+        graph = SimpleDirectedGraph.load_from_file(path, adjacency="set", track_inbound=True)
+        self.assertEqual(list(graph.neighbours_view("2")), ["1", "3"])
+        self.assertEqual(graph.inbound_neighbours("2"), ["1", "3"])
+
+    def test_errors(self):
+        for content in ["directed\n1 2\n", "undirected weighted\n1 2\n",
+                        "undirected unweighted\n1 2 3\n", "undirected unweighted\n1 2\n2 1\n"]:
+            with self.assertRaises(ValueError):
+                SimpleDirectedGraph.load_from_file(self.write(content))
+
+
+class TestInboundIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = SimpleDirectedGraph(track_inbound=True)
+        self.graph.change_if_directed()
+        self.graph.change_if_weighted()
+        for v in ["1", "2", "3", "4"]:
+            self.graph.add_vertex(v)
+        self.graph.add_edge("1", "3", 1)
+        self.graph.add_edge("2", "3", 2)
+        self.graph.add_edge("3", "4", 3)
+
+    def test_inbound_neighbours(self):
+        self.assertEqual(sorted(self.graph.inbound_neighbours("3")), ["1", "2"])
+        self.graph.remove_edge("1", "3")
+        self.assertEqual(self.graph.inbound_neighbours("3"), ["2"])
+        self.graph.set_weight("2", "3", 7)
+        self.assertEqual(self.graph.inbound_neighbours("3"), ["2"])
+
+    def test_remove_vertex(self):
+        self.graph.remove_vertex("3")
+        self.assertEqual(self.graph.graph_repo["1"], [])
+        self.assertEqual(self.graph.inbound_neighbours("4"), [])
+        self.assertNotIn("3", self.graph.graph_weight_repo["2"])
+
+    def test_change_if_directed(self):
+        self.graph.change_if_directed()
+        self.assertEqual(sorted(self.graph.inbound_neighbours("3")), ["1", "2", "4"])
+        self.graph.change_if_directed()
+        self.assertEqual(sorted(self.graph.inbound_neighbours("3")), ["1", "2", "4"])
+        self.assertEqual(sorted(self.graph.inbound_neighbours("1")), ["3"])
+
+
+class TestConnectivityIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = SimpleDirectedGraph(track_components=True)
+        for v in ["1", "2", "3", "4"]:
+            self.graph.add_vertex(v)
+        self.graph.add_edge("1", "2")
+        self.graph.add_edge("3", "4")
+
+    def test_incremental(self):
+        self.assertEqual(self.graph.component_count(), 2)
+        self.assertTrue(self.graph.same_component("1", "2"))
+        self.assertFalse(self.graph.is_connected())
+        self.graph.add_edge("2", "3")
+        self.assertTrue(self.graph.is_connected())
+        self.assertIs(self.graph.components, self.graph._component_index())
+
+    def test_deletions(self):
+        self.graph.add_edge("2", "3")
+        self.graph.remove_edge("2", "3")
+        self.assertEqual(self.graph.component_count(), 2)
+        self.graph.remove_vertex("4")
+        self.graph.add_vertex("5")
+        self.assertEqual(self.graph.component_count(), 3)
+        self.assertFalse(self.graph.same_component("3", "5"))
+
+    def test_untracked(self):
+        graph = SimpleDirectedGraph()
+        graph.add_vertex("1")
+        graph.add_vertex("2")
+        self.assertEqual(graph.component_count(), 2)
+        with self.assertRaises(ValueError):
+            graph.same_component("1", "3")
+
+
+class TestSetAdjacency(unittest.TestCase):
+
+    def build(self, adjacency):
+        graph = SimpleDirectedGraph(adjacency=adjacency)
+        for v in ["1", "2", "3", "4", "5"]:
+            graph.add_vertex(v)
+        for v1, v2 in [("1", "3"), ("1", "2"), ("2", "4"), ("3", "5"), ("4", "5")]:
+            graph.add_edge(v1, v2)
+        return graph
+
+    def test_edges(self):
+        graph = self.build("set")
+        self.assertTrue(graph.is_edge("3", "1"))
+        with self.assertRaises(ValueError):
+            graph.add_edge("1", "2")
+        graph.remove_edge("1", "2")
+        self.assertFalse(graph.is_edge("1", "2"))
+        self.assertEqual(graph.neighbours("1"), ["3"])
+        graph.remove_vertex("5")
+        self.assertEqual(graph.get_e(), 2)
+
+    def test_self_loops(self):
+        graphs = {}
+        for adjacency in ["list", "set"]:
+            graph = SimpleDirectedGraph(adjacency=adjacency)
+            for v in "abc":
+                graph.add_vertex(v)
+            for v1, v2 in [("a", "a"), ("a", "b")]:
+                graph.add_edge(v1, v2)
+            graphs[adjacency] = graph
+        self.assertEqual(graphs["set"].get_e(), graphs["list"].get_e())
+        self.assertEqual(graphs["set"].get_e(), 2)
+        self.assertEqual(find_eulerian_trail(graphs["set"]), find_eulerian_trail(graphs["list"]))
+        self.assertEqual(find_eulerian_trail(graphs["set"]), ["a", "a", "b"])
+        for adjacency, graph in graphs.items():
+            for v1, v2 in [("b", "c"), ("c", "a")]:
+                graph.add_edge(v1, v2)
+            self.assertEqual(len(get_eul_circuit(graph)), 5, adjacency)
+
+            version = graph.version
+            graph.remove_edge("a", "a")
+            self.assertFalse(graph.is_edge("a", "a"), adjacency)
+            self.assertEqual((graph.get_e(), graph.version), (3, version + 1), adjacency)
+
+    def test_traversal_order(self):
+        list_graph = self.build("list")
+        set_graph = self.build("set")
+        self.assertEqual(list(set_graph.bfs_iter("1")), list(list_graph.bfs_iter("1")))
+        self.assertEqual(list(set_graph.dfs_iter("1")), list(list_graph.dfs_iter("1")))
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            SimpleDirectedGraph(adjacency="tree")
+
+
+def random_weighted_graph(seed, vertex_count=30, edge_count=90, directed=True, **options):
+    rng = random.Random(seed)
+    graph = SimpleDirectedGraph(**options)
+    if directed:
+        graph.change_if_directed()
+    graph.change_if_weighted()
+    for v in range(vertex_count):
+        graph.add_vertex(str(v))
+    for _ in range(edge_count):
+        v1, v2 = str(rng.randrange(vertex_count)), str(rng.randrange(vertex_count))
+        if v1 != v2 and not graph.is_edge(v1, v2):
+            graph.add_edge(v1, v2, rng.randint(1, 20))
+    return graph
+
+
+class TestShortestPaths(unittest.TestCase):
+
+    def test_delta_stepping(self):
+        for seed, directed in [(5, True), (6, False)]:
+            graph = random_weighted_graph(seed, vertex_count=60, edge_count=200, directed=directed)
+            expected = dijkstra(graph, "0")[0]
+            for delta, workers, batch_size in [(None, 1, 1024), (1, 1, 1024), (30, 2, 8)]:
+                distances, previous, _, cost_calls, buckets, re_relaxations = \
+                    delta_stepping(graph, "0", delta, workers, batch_size)
+                self.assertEqual(distances, expected)
+                for vertex, parent in previous.items():
+                    if parent is not None:
+                        self.assertEqual(distances[parent] + graph.get_weight(parent, vertex), distances[vertex])
+                self.assertGreater(buckets, 0)
+                self.assertGreaterEqual(cost_calls, 0)
+            # one bucket spanning every distance is Bellman-Ford with light edges only
+            self.assertEqual(delta_stepping(graph, "0", 10 ** 6, 1)[4], 1)
+
+        graph.set_weight("0", next(iter(graph.neighbours_view("0"))), -1)
+        with self.assertRaises(ValueError):
+            delta_stepping(graph, "0")
+
+    def test_delta_stepping_small_batches(self):
+        graph = random_weighted_graph(7, vertex_count=20, edge_count=60)
+        # every batch fits in batch_size, so no worker process is started
+        with mock.patch("multiprocessing.get_context", side_effect=AssertionError):
+            distances = delta_stepping(graph, "0", workers=4)[0]
+        self.assertEqual(distances, dijkstra(graph, "0")[0])
+
+    def test_bidirectional_dijkstra(self):
+        for seed, directed, track_inbound in [(1, True, True), (2, True, True), (3, False, True), (6, True, False)]:
+            graph = random_weighted_graph(seed, directed=directed, track_inbound=track_inbound)
+            distances = dijkstra(graph, "0")[0]
+            for target in graph.return_vertices_list():
+                cost, path = bidirectional_dijkstra(graph, "0", target)[:2]
+                self.assertEqual(cost, distances[target])
+                if path:
+                    self.assertEqual((path[0], path[-1]), ("0", target))
+                    self.assertEqual(sum(graph.get_weight(a, b) for a, b in zip(path, path[1:])), cost)
+                else:
+                    self.assertEqual(cost, float('inf'))
+        # the reverse adjacency is built once per query instead of scanning per backward step
+        with mock.patch.object(graph, "iter_inbound_neighbours", side_effect=AssertionError):
+            bidirectional_dijkstra(graph, "0", target)
+
+    def test_a_star_alt(self):
+        for seed, directed in [(4, True), (5, False)]:
+            graph = random_weighted_graph(seed, directed=directed, track_inbound=True)
+            heuristic = ALTHeuristic(graph, landmark_count=3, seed=seed)
+            self.assertEqual(len(heuristic.landmarks), 3)
+            distances = dijkstra(graph, "0")[0]
+            for target in graph.return_vertices_list():
+                self.assertLessEqual(heuristic("0", target), distances[target])
+                cost, path = a_star(graph, "0", target, heuristic)[:2]
+                self.assertEqual(cost, distances[target])
+                self.assertEqual(bool(path), cost != float('inf'))
+
+    def test_alt_without_inbound_index(self):
+        graph = random_weighted_graph(4, directed=True)
+        expected = ALTHeuristic(random_weighted_graph(4, directed=True, track_inbound=True), landmark_count=3, seed=4)
+        # the reverse adjacency is built once instead of scanning the graph per backward step
+        with mock.patch.object(graph, "iter_inbound_neighbours", side_effect=AssertionError):
+            heuristic = ALTHeuristic(graph, landmark_count=3, seed=4)
+        self.assertEqual(heuristic.landmarks, expected.landmarks)
+        self.assertEqual(heuristic.to_landmark, expected.to_landmark)
+
+
+    def test_contraction_hierarchy(self):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        for seed, directed in [(6, True), (7, False)]:
+            graph = random_weighted_graph(seed, directed=directed)
+            ContractionHierarchy.build(graph, settle_limit=5).save(path)
+            hierarchy = ContractionHierarchy.load(path)
+            for source in ["0", "1", "2"]:
+                distances = dijkstra(graph, source)[0]
+                for target in graph.return_vertices_list():
+                    cost, walk = hierarchy.query(source, target)[:2]
+                    self.assertEqual(cost, distances[target])
+                    if walk:
+                        self.assertEqual((walk[0], walk[-1]), (source, target))
+                        self.assertEqual(sum(graph.get_weight(a, b) for a, b in zip(walk, walk[1:])), cost)
+
+
+    def test_version_counter(self):
+        graph = SimpleDirectedGraph()
+        versions = [graph.version]
+        for mutate in [lambda: graph.add_vertex("1"), lambda: graph.add_vertex("2"),
+                       graph.change_if_weighted, lambda: graph.add_edge("1", "2", 3),
+                       lambda: graph.set_weight("1", "2", 4), lambda: graph.remove_edge("1", "2"),
+                       graph.change_if_directed, lambda: graph.remove_vertex("2")]:
+            mutate()
+            versions.append(graph.version)
+        self.assertEqual(len(set(versions)), len(versions))
+
+        with self.assertRaises(ValueError):
+            graph.add_vertex("1")
+        self.assertEqual(graph.version, versions[-1])
+
+    def test_shortest_path_cache(self):
+        graph = random_weighted_graph(8)
+        cache = ShortestPathCache(graph, max_entries=2)
+        self.assertEqual(cache.get("0"), dijkstra(graph, "0")[:2])
+        cache.get("0")
+        cache.get("1")
+        cache.get("2")
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 3)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(list(cache.entries), ["1", "2"])
+
+        graph.add_vertex("new")
+        graph.add_edge("1", "new", 1)
+        self.assertEqual(cache.get("1"), dijkstra(graph, "1")[:2])
+        self.assertEqual(cache.stats()["invalidations"], 2)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+        small = ShortestPathCache(graph, max_bytes=1)
+        small.get("0")
+        self.assertEqual(small.stats()["entries"], 0)
+
+
+    def test_search_metrics(self):
+        graph = random_weighted_graph(9)
+        metrics = SearchMetrics(track_memory=True)
+        result = dijkstra(graph, "0", metrics=metrics)
+        uniform_cost_search(graph, "0", metrics=metrics)
+        UCS2.uniform_cost_search(graph, "0", "5", metrics=metrics)
+
+        exported = json.loads(metrics.to_json())
+        self.assertEqual(exported["runs"], 3)
+        self.assertGreaterEqual(exported["counters"]["heap_pops"], result[5])
+        self.assertEqual(sum(exported["frontier_histogram"].values()), exported["counters"]["heap_pops"])
+        self.assertIn("search", exported["phases_ms"])
+        self.assertGreater(exported["peak_memory_bytes"], 0)
+
+
+    def test_priority_queues(self):
+        graph = random_weighted_graph(10, vertex_count=60, edge_count=300)
+        expected = dijkstra(graph, "0")
+        for queue in ["heap", "dial", "radix", "indexed"]:
+            result = dijkstra(graph, "0", queue=queue)
+            self.assertEqual(result[0], expected[0], queue)
+            self.assertEqual(uniform_cost_search(graph, "0", queue=queue)[0], expected[0], queue)
+            self.assertEqual(UCS2.uniform_cost_search(graph, "0", "5", queue=queue)[0], expected[0], queue)
+            self.assertGreater(result[4], 0)
+            self.assertGreater(result[5], 0)
+        self.assertLessEqual(dijkstra(graph, "0", queue="indexed")[5], expected[5])
+
+        graph.set_weight(*next((v1, v2) for v1 in graph.return_vertices_list()
+                               for v2 in graph.neighbours_view(v1)), -1)
+        with self.assertRaises(ValueError):
+            dijkstra(graph, "0", queue="dial")
+        with self.assertRaises(ValueError):
+            dijkstra(graph, "0", queue="fibonacci")
+
+
+class TestSpanningTrees(unittest.TestCase):
+
+    def test_disjoint_set(self):
+        forest = DisjointSet(range(5))
+        self.assertTrue(forest.union(0, 1))
+        self.assertTrue(forest.union(3, 4))
+        self.assertFalse(forest.union(1, 0))
+        self.assertTrue(forest.connected(0, 1))
+        self.assertFalse(forest.connected(1, 3))
+        self.assertEqual(forest.set_count, 3)
+        with self.assertRaises(ValueError):
+            forest.find(7)
+
+    def test_min_spanning_tree(self):
+        vertex_count, edges = benchmark.random_sparse_graph(120, seed=2)
+        graph = SimpleDirectedGraph()
+        graph.change_if_weighted()
+        for v in range(vertex_count):
+            graph.add_vertex(str(v))
+        for v1, v2, weight in edges:
+            graph.add_edge(str(v1), str(v2), weight)
+
+        def total(tree):
+            return sum(weight for v1 in tree.return_vertices_list() for _, weight in tree.iter_neighbours(v1)) // 2
+
+        trees = [min_spanning_tree(graph, algorithm) for algorithm in ["auto", "kruskal", "prim"]]
+        for tree in trees:
+            self.assertEqual(tree.get_e(), vertex_count - 1)
+            self.assertTrue(tree.is_weighted and not tree.is_directed)
+        self.assertEqual(len({total(tree) for tree in trees}), 1)
+
+        with self.assertRaises(ValueError):
+            min_spanning_tree(graph, "boruvka")
+
+        for workers in [1, 3]:
+            forest = minimum_spanning_forest(graph, workers=workers)
+            self.assertEqual(forest.get_e(), vertex_count - 1)
+            self.assertEqual(total(forest), total(trees[0]))
+
+        graph.add_vertex("isolated")
+        graph.add_vertex("a")
+        graph.add_vertex("b")
+        graph.add_edge("a", "b", 4)
+        forest = minimum_spanning_forest(graph, workers=2)
+        self.assertEqual(forest.get_e(), vertex_count - 1 + 1)
+        self.assertEqual(forest.component_count(), 3)
+
+
+class TestCliques(unittest.TestCase):
+
+    def test_matches_backtracking(self):
+        for seed in range(6):
+            graph = random_weighted_graph(seed, vertex_count=14, edge_count=45, directed=False)
+            expected = find_maximum_cliques_backtracking(graph)
+            self.assertEqual(find_maximum_cliques(graph), expected)
+            self.assertEqual(find_maximum_cliques(graph, use_colouring_bound=False), expected)
+
+            maximal = [set(clique) for clique in find_maximal_cliques(graph)]
+            self.assertEqual(len(maximal), len({frozenset(clique) for clique in maximal}))
+            for clique in expected:
+                self.assertIn(set(clique), maximal)
+
+    def test_bitset_kernels(self):
+        for seed in range(4):
+            graph = random_weighted_graph(seed, vertex_count=16, edge_count=70, directed=False)
+            vertices = graph.return_vertices_list()
+            triangles = sum(1 for i, v1 in enumerate(vertices) for j, v2 in enumerate(vertices[i + 1:], i + 1)
+                            for v3 in vertices[j + 1:]
+                            if graph.is_edge(v1, v2) and graph.is_edge(v2, v3) and graph.is_edge(v1, v3))
+            results = []
+            for density in [0.0, 2.0]:
+                with mock.patch.object(Assigment6, "DENSE_GRAPH_DENSITY", density):
+                    results.append((find_maximum_cliques(graph),
+                                    sorted(sorted(clique) for clique in find_maximal_cliques(graph)),
+                                    count_triangles(graph)))
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[0][2], triangles)
+
+    def test_bitset_adjacency(self):
+        graph = SimpleDirectedGraph()
+        for vertex in "abcd":
+            graph.add_vertex(vertex)
+        for v1, v2 in ["ab", "ac", "bc", "cd"]:
+            graph.add_edge(v1, v2)
+        bits = graph.to_bitset()
+        self.assertIs(graph.to_bitset(), bits)
+        a, b, c, d = (graph.vertex_id(vertex) for vertex in "abcd")
+        self.assertEqual(bits.degree(c), 3)
+        self.assertEqual(bits.to_labels(bits.common_neighbours(a, b)), ["c"])
+        self.assertTrue(bits.is_clique([a, b, c]))
+        self.assertFalse(bits.is_clique([a, b, d]))
+        self.assertTrue(bits.is_subset(to_mask([a, b]), c))
+        self.assertEqual(list(iter_bits(to_mask([d, a]))), sorted([a, d]))
+
+        graph.add_edge("a", "d")
+        bits = graph.to_bitset()
+        self.assertTrue(bits.has_edge(d, a))
+        self.assertEqual(count_triangles(graph), 2)
+
+    def test_budget(self):
+        vertex_count, edges = benchmark.scale_free_graph(3000, seed=1)
+        graph = SimpleDirectedGraph()
+        for v in range(vertex_count):
+            graph.add_vertex(str(v))
+        for v1, v2, _ in edges:
+            graph.add_edge(str(v1), str(v2))
+
+        stats = {}
+        cliques = find_maximum_cliques(graph, stats=stats)
+        self.assertFalse(stats["budget_exhausted"])
+        self.assertEqual(len(cliques[0]), 4)
+
+        stats = {}
+        partial = find_maximum_cliques(graph, node_budget=5, stats=stats)
+        self.assertTrue(stats["budget_exhausted"])
+        self.assertLessEqual(len(partial[0]), 4)
+
+        graph.change_if_directed()
+        with self.assertRaises(ValueError):
+            find_maximum_cliques(graph)
+
+
+class TestEulerian(unittest.TestCase):
+
+    def assertTrail(self, graph, trail):
+        used = set()
+        for v1, v2 in zip(trail, trail[1:]):
+            self.assertTrue(graph.is_edge(v1, v2))
+            used.add((v1, v2) if graph.is_directed else frozenset((v1, v2)))
+        self.assertEqual(len(used), graph.get_e())
+        self.assertEqual(len(trail), graph.get_e() + 1)
+
+    def cycle_graph(self, directed, cycles):
+        graph = SimpleDirectedGraph()
+        if directed:
+            graph.change_if_directed()
+        for vertex in {vertex for cycle in cycles for vertex in cycle}:
+            graph.add_vertex(vertex)
+        for cycle in cycles:
+            for v1, v2 in zip(cycle, cycle[1:] + cycle[:1]):
+                graph.add_edge(v1, v2)
+        return graph
+
+    def test_circuit(self):
+        for directed in [True, False]:
+            graph = self.cycle_graph(directed, ["abcd", "aefg", "chij"])
+            self.assertTrue(check_if_eul(graph))
+            circuit = get_eul_circuit(graph)
+            self.assertTrail(graph, circuit)
+            self.assertEqual(circuit[0], circuit[-1])
+            self.assertEqual(get_eul_circuit(graph), circuit)
+            self.assertEqual(find_eulerian_trail(graph.to_csr(), start="h")[0], "h")
+
+    def test_path(self):
+        graph = SimpleDirectedGraph.create_from_file('input.txt')
+        self.assertFalse(check_if_eul(graph))
+        self.assertEqual(get_eul_circuit(graph), [])
+        path = get_eul_path(graph)
+        self.assertTrail(graph, path)
+        self.assertEqual({path[0], path[-1]}, {"6", "1"})
+        self.assertEqual(find_eulerian_trail(graph, start="1")[0], "1")
+        self.assertEqual(find_eulerian_trail(graph, start="3"), [])
+
+        graph = self.cycle_graph(True, ["abc"])
+        graph.add_vertex("d")
+        graph.add_edge("c", "d")
+        path = get_eul_path(graph)
+        self.assertTrail(graph, path)
+        self.assertEqual(path[-1], "d")
+        graph.add_edge("d", "a")
+        graph.add_vertex("x")
+        graph.add_vertex("y")
+        graph.add_edge("x", "y")
+        self.assertEqual(get_eul_path(graph), [])
+
+    def test_no_edges(self):
+        graph = SimpleDirectedGraph()
+        graph.add_vertex("a")
+        self.assertEqual(find_eulerian_trail(graph), ["a"])
+        self.assertEqual(find_eulerian_trail(graph, start="a"), ["a"])
+        with self.assertRaises(ValueError):
+            find_eulerian_trail(graph, start="z")
+
+
+@unittest.skipIf(vectorized is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+
+    def test_bfs(self):
+        graph = random_weighted_graph(4, vertex_count=60, edge_count=150)
+        csr = graph.to_csr()
+        depths, parents = vectorized.bfs(csr, 0)
+        expected = dict(csr.bfs_iter(csr.vertex_label(0)))
+        for vertex_id in range(csr.get_v()):
+            self.assertEqual(depths[vertex_id], expected.get(vertex_id, -1))
+            if depths[vertex_id] > 0:
+                self.assertEqual(depths[parents[vertex_id]], depths[vertex_id] - 1)
+                self.assertIn(vertex_id, list(csr.neighbour_ids(parents[vertex_id])))
+
+        depths, _ = vectorized.bfs(csr, [0, 5], max_depth=2)
+        self.assertEqual(depths[5], 0)
+        self.assertLessEqual(depths.max(), 2)
+        with self.assertRaises(ValueError):
+            vectorized.bfs(csr, csr.get_v())
+
+    def test_bellman_ford(self):
+        for seed, directed in [(1, True), (2, False)]:
+            csr = random_weighted_graph(seed, directed=directed).to_csr()
+            expected = dijkstra_csr(csr, 0)[0]
+            for delta in [None, 1, float('inf')]:
+                distances, previous = vectorized.bellman_ford(csr, 0, delta)[:2]
+                self.assertEqual(list(distances), expected)
+                for vertex_id, parent in enumerate(previous):
+                    if parent >= 0:
+                        self.assertLess(distances[parent], float('inf'))
+
+        graph = SimpleDirectedGraph()
+        graph.change_if_directed()
+        graph.change_if_weighted()
+        for vertex in "abcd":
+            graph.add_vertex(vertex)
+        for v1, v2, weight in [("a", "b", 4), ("a", "c", 1), ("c", "b", -3), ("b", "d", 2)]:
+            graph.add_edge(v1, v2, weight)
+        csr = graph.to_csr()
+        distances, previous = vectorized.bellman_ford(csr, csr.vertex_id("a"))[:2]
+        self.assertEqual(distances[csr.vertex_id("d")], 0)
+        self.assertEqual(csr.vertex_label(previous[csr.vertex_id("b")]), "c")
+
+        graph.add_edge("d", "c", -1)
+        with self.assertRaises(ValueError):
+            vectorized.bellman_ford(graph.to_csr(), 0)
+
+    def test_connected_components(self):
+        graph = random_weighted_graph(3, vertex_count=80, edge_count=60, directed=False)
+        labels, count = vectorized.connected_components(graph.to_csr())
+        self.assertEqual(count, graph.component_count())
+        csr = graph.to_csr()
+        for vertex_id in range(csr.get_v()):
+            for neighbor_id in csr.neighbour_ids(vertex_id):
+                self.assertEqual(labels[vertex_id], labels[neighbor_id])
+            self.assertLessEqual(labels[vertex_id], vertex_id)
+
+
+@unittest.skipIf(vectorized is None, "NumPy is not installed")
+class TestAllPairsShortestPaths(unittest.TestCase):
+
+    def test_matches_dijkstra(self):
+        for seed, directed in [(7, True), (8, False)]:
+            graph = random_weighted_graph(seed, vertex_count=25, edge_count=80, directed=directed)
+            expected = {source: dijkstra(graph, source)[0] for source in graph.return_vertices_list()}
+            for method, workers in [("floyd_warshall", 1), ("johnson", 1), ("johnson", 2), ("auto", None)]:
+                with all_pairs_shortest_paths(graph, method=method, workers=workers) as distances:
+                    for source, row in expected.items():
+                        for target, distance in row.items():
+                            self.assertEqual(distances.distance(source, target), distance)
+                    self.assertEqual(len(list(distances.iter_rows())), graph.get_v())
+                    path = distances.file_path
+                self.assertFalse(os.path.exists(path))
+
+    def test_floyd_warshall_blocks(self):
+        graph = random_weighted_graph(9, vertex_count=25, edge_count=80)
+        csr = graph.to_csr()
+        expected = [[dijkstra(graph, source)[0][target] for target in csr.labels] for source in csr.labels]
+        for block_rows in [1, 4, 25]:
+            matrix = np.zeros((25, 25), dtype=np.int32)
+            APSP.floyd_warshall(csr, matrix, block_rows)
+            unreachable = np.iinfo(np.int32).max
+            self.assertEqual([[float('inf') if value == unreachable else value for value in row]
+                              for row in matrix.tolist()], expected)
+        # no distance exceeds (V - 1) * max|w| in absolute value
+        self.assertEqual(APSP._result_dtype(np.array([2 ** 20]), 2 ** 10), np.int32)
+        self.assertEqual(APSP._result_dtype(np.array([2 ** 20]), 2 ** 12), np.int64)
+
+    def test_negative_weights(self):
+        graph = SimpleDirectedGraph()
+        graph.change_if_directed()
+        graph.change_if_weighted()
+        for vertex in "abcde":
+            graph.add_vertex(vertex)
+        for v1, v2, weight in [("a", "b", 4), ("a", "c", 1), ("c", "b", -3), ("b", "d", 2), ("d", "a", 5)]:
+            graph.add_edge(v1, v2, weight)
+
+        handle, path = tempfile.mkstemp(suffix=".npy")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        all_pairs_shortest_paths(graph, path, method="johnson").close()
+        distances = DistanceMatrix.open(path, graph.to_csr().labels)
+        self.assertEqual(distances.distance("a", "d"), 0)
+        self.assertEqual(distances.distance("d", "b"), 3)
+        self.assertEqual(distances.distance("a", "e"), float('inf'))
+        with all_pairs_shortest_paths(graph, method="floyd_warshall") as floyd:
+            self.assertEqual(floyd.matrix.tolist(), distances.matrix.tolist())
+        distances.close()
+
+        graph.add_edge("d", "c", -4)
+        for method in ["floyd_warshall", "johnson"]:
+            with self.assertRaises(ValueError):
+                all_pairs_shortest_paths(graph, method=method)
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_generators(self):
+        for name, generator in benchmark.GENERATORS.items():
+            vertex_count, edges = generator(200, seed=3)
+            self.assertEqual(generator(200, seed=3), (vertex_count, edges))
+            handle, path = tempfile.mkstemp(suffix=".txt")
+            os.close(handle)
+            self.addCleanup(os.remove, path)
+            benchmark.write_graph_file(path, vertex_count, edges)
+            graph = SimpleDirectedGraph.load_from_file(path)
+            self.assertEqual(graph.get_v(), vertex_count, name)
+            self.assertEqual(sum(1 for _ in graph.bfs_iter("0")), vertex_count, name)
+            circuit = get_eul_circuit(benchmark.eulerian_graph(vertex_count, edges))
+            self.assertEqual(len(circuit), 2 * len(edges) + 1, name)
+
+    def test_compare_results(self):
+        baseline = {"results": [{"generator": "grid", "size": 10, "benchmark": "dijkstra", "seconds": 1.0}]}
+        current = {"results": [{"generator": "grid", "size": 10, "benchmark": "dijkstra", "seconds": 1.5}]}
+        self.assertEqual(benchmark.compare_results(baseline, current, 0.2), [("grid", 10, "dijkstra", 1.0, 1.5)])
+        self.assertEqual(benchmark.compare_results(baseline, current, 0.6), [])
+
+
+class TestCSRGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = SimpleDirectedGraph()
+        self.graph.change_if_directed()
+        self.graph.change_if_weighted()
+        for v in ["1", "2", "3", "4", "5"]:
+            self.graph.add_vertex(v)
+        self.graph.add_edge("1", "2", 5)
+        self.graph.add_edge("1", "3", 1)
+        self.graph.add_edge("3", "2", 2)
+        self.graph.add_edge("2", "4", 1)
+
+    def test_freeze(self):
+        csr = self.graph.freeze()
+        self.assertEqual(csr.get_v(), 5)
+        self.assertEqual(csr.get_e(), 4)
+        one = csr.vertex_id("1")
+        self.assertEqual([csr.vertex_label(v) for v in csr.neighbour_ids(one)], ["2", "3"])
+        self.assertEqual(list(csr.weights[csr.offsets[one]:csr.offsets[one + 1]]), [5, 1])
+
+        with self.assertRaises(TypeError):
+            csr.targets[0] = 3
+
+        self.graph.add_edge("4", "5", 1)
+        self.assertEqual(csr.get_e(), 4)
+
+    def test_snapshot_cache(self):
+        csr = self.graph.to_csr()
+        self.assertIs(self.graph.to_csr(), csr)
+        self.graph.set_weight("1", "2", 7)
+        self.assertIsNot(self.graph.to_csr(), csr)
+        self.assertEqual(dijkstra(self.graph, "1")[0]["2"], 3)
+        self.assertEqual(list(self.graph.iter_neighbour_ids(self.graph.vertex_id("1"))),
+                         [(self.graph.vertex_id("2"), 7), (self.graph.vertex_id("3"), 1)])
+
+    def test_binary_round_trip(self):
+        handle, path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        self.graph.save_binary(path)
+
+        csr = SimpleDirectedGraph.load_binary(path)
+        self.assertEqual(list(csr.labels), ["1", "2", "3", "4", "5"])
+        self.assertTrue(csr.is_directed and csr.is_weighted)
+        self.assertEqual(dijkstra_csr(csr, csr.vertex_id("1"))[0], [0, 3, 1, 4, float('inf')])
+
+        graph = csr.thaw()
+        self.assertEqual(graph.graph_repo, self.graph.graph_repo)
+        self.assertEqual(graph.graph_weight_repo, self.graph.graph_weight_repo)
+
+    def test_dijkstra_many(self):
+        sources = ["1", "2", "3"]
+        for workers in [1, 2]:
+            results = {source: (distances, previous)
+                       for source, distances, previous in dijkstra_many(self.graph, sources, workers=workers)}
+            self.assertEqual(sorted(results), sources)
+            for source in sources:
+                self.assertEqual(results[source], dijkstra(self.graph, source)[:2])
+
+    def test_snapshot_pool_without_fork(self):
+        # without fork the workers memory-map a temporary binary copy of the snapshot
+        graph = random_weighted_graph(3, directed=False)
+        with mock.patch("multiprocessing.get_all_start_methods", return_value=["spawn"]):
+            results = {source: distances for source, distances, _ in dijkstra_many(self.graph, ["1", "2"], workers=2)}
+            forest = minimum_spanning_forest(graph, workers=2)
+        self.assertEqual(results["2"], dijkstra(self.graph, "2")[0])
+        self.assertEqual(forest.graph_weight_repo, minimum_spanning_forest(graph, workers=1).graph_weight_repo)
+
+    def test_dijkstra_many_interleaved(self):
+        other = SimpleDirectedGraph()
+        other.change_if_weighted()
+        other.add_vertex("1")
+        other.add_vertex("9")
+        other.add_edge("1", "9", 4)
+        first = dijkstra_many(self.graph, ["1", "2"], workers=1)
+        second = dijkstra_many(other, ["1", "9"], workers=1)
+        self.assertEqual(next(first)[1], dijkstra(self.graph, "1")[0])
+        self.assertEqual(next(second)[1], {"1": 0, "9": 4})
+        second.close()
+        self.assertEqual(next(first)[1], dijkstra(self.graph, "2")[0])
+
+    def test_iterators(self):
+        csr = self.graph.to_csr()
+        bfs = [(csr.vertex_label(v), d) for v, d in csr.bfs_iter("1")]
+        self.assertEqual(bfs, list(self.graph.bfs_iter("1")))
+        dfs = [(csr.vertex_label(v), d) for v, d in csr.dfs_iter("1")]
+        self.assertEqual(dfs, list(self.graph.dfs_iter("1")))
+
+    def test_shortest_paths(self):
+        csr = self.graph.freeze()
+        distances = dijkstra(self.graph, "1")[0]
+        csr_distances = dijkstra_csr(csr, csr.vertex_id("1"))[0]
+        ucs_distances = uniform_cost_search_csr(csr, csr.vertex_id("1"))[0]
+        for vertex in self.graph.return_vertices_list():
+            self.assertEqual(csr_distances[csr.vertex_id(vertex)], distances[vertex])
+            self.assertEqual(ucs_distances[csr.vertex_id(vertex)], distances[vertex])
+        self.assertEqual(uniform_cost_search(self.graph, "1")[0], distances)
+
+
 if __name__ == "__main__":
     unittest.main()